@@ -7,15 +7,29 @@ to get the latest news and announcements directly from the source.
 Includes improved selectors and more robust error handling.
 """
 
+import asyncio
 import requests
-from bs4 import BeautifulSoup
 import json
 import logging
 import time
-import random
 import os
-from datetime import datetime, timedelta
-from urllib.parse import urljoin
+import threading
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from datetime import datetime
+from urllib.parse import urljoin, urlparse
+
+from async_fetcher import get_async_fetcher
+from date_normalizer import DateNormalizer, filter_recent
+from description_extractor import extract_description
+from html_backend import get_parser_backend
+from feed_parser import FeedEntryParser, html_to_text
+from http_cache import ConditionalCache
+from http_session import get_session
+from rate_limiter import get_rate_limiter
+from source_registry import get_source_registry
+from story_dedup import dedupe_articles
 
 # Set up logging
 logging.basicConfig(
@@ -27,8 +41,30 @@ logger = logging.getLogger('ai_blog_scraper_improved')
 class AIBlogScraperImproved:
     """Class to handle scraping AI company blogs and news pages with improved robustness"""
     
-    def __init__(self):
-        """Initialize the scraper with common headers and settings"""
+    def __init__(self, session=None, http_cache=None, parser_backend=None, seen_index=None, rate_limiter=None,
+                 registry=None):
+        """
+        Initialize the scraper with common headers and settings
+        
+        Args:
+            session (requests.Session, optional): HTTP session to use, defaults to the shared pooled session
+            http_cache (ConditionalCache, optional): ETag/Last-Modified cache, defaults to the on-disk cache
+            parser_backend (str, optional): HTML parser backend ("selectolax", "lxml" or "html.parser"),
+                defaults to the fastest one installed
+            seen_index (SeenArticleIndex, optional): Articles handled by previous runs; listings
+                are only walked until the first known article when given
+            rate_limiter (HostRateLimiter, optional): Per-host request budget, defaults to the shared limiter
+            registry (SourceRegistry, optional): Configured sources, defaults to the registry for sources.json
+        """
+        self.session = session or get_session()
+        self.http_cache = http_cache or ConditionalCache()
+        self.parser_backend = get_parser_backend(parser_backend)
+        self._blog_backends = {}
+        self.date_normalizer = DateNormalizer()
+        self.seen_index = seen_index
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        logger.info(f"Using '{self.parser_backend.name}' HTML parser backend")
+        
         # Use a more browser-like user agent to avoid being blocked
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -39,235 +75,561 @@ class AIBlogScraperImproved:
             "Cache-Control": "max-age=0"
         }
         
-        # Define the company blogs to scrape with their specific selectors
-        # Updated selectors based on current website structures
-        self.blogs = [
-            {
-                "name": "OpenAI",
-                "url": "https://openai.com/blog",
-                "article_selector": "a[href^='/blog/']",
-                "title_selector": "h2, h3",
-                "date_selector": "time",
-                "description_selector": "p",
-                "base_url": "https://openai.com",
-                "use_rss": False,
-                "rss_url": ""
-            },
-            {
-                "name": "Microsoft AI",
-                "url": "https://blogs.microsoft.com/ai/",
-                "article_selector": "article.post",
-                "title_selector": "h3.entry-title a",
-                "date_selector": "time.entry-date",
-                "description_selector": "div.entry-summary p",
-                "base_url": "",
-                "use_rss": True,
-                "rss_url": "https://blogs.microsoft.com/ai/feed/"
-            },
-            {
-                "name": "Google AI",
-                "url": "https://ai.googleblog.com/",
-                "article_selector": "div.post",
-                "title_selector": "h2.title a",
-                "date_selector": "div.published",
-                "description_selector": "div.post-body",
-                "base_url": "",
-                "use_rss": True,
-                "rss_url": "http://ai.googleblog.com/feeds/posts/default"
-            },
-            {
-                "name": "Anthropic",
-                "url": "https://www.anthropic.com/news",
-                "article_selector": "a[href^='/news/']",
-                "title_selector": "h3",
-                "date_selector": "time",
-                "description_selector": "p",
-                "base_url": "https://www.anthropic.com",
-                "use_rss": False,
-                "rss_url": ""
-            },
-            {
-                "name": "Hugging Face",
-                "url": "https://huggingface.co/blog",
-                "article_selector": "a.group",
-                "title_selector": "p.font-bold",
-                "date_selector": "p.text-sm",
-                "description_selector": "p:not(.font-bold):not(.text-sm)",
-                "base_url": "https://huggingface.co",
-                "use_rss": False,
-                "rss_url": ""
-            },
-            {
-                "name": "Meta AI",
-                "url": "https://ai.meta.com/blog/",
-                "article_selector": "div.blog-card",
-                "title_selector": "h3",
-                "date_selector": "div.blog-card__date",
-                "description_selector": "p.blog-card__description",
-                "base_url": "https://ai.meta.com",
-                "use_rss": True,
-                "rss_url": "https://ai.meta.com/blog/rss/"
-            }
-        ]
+        # Feed downloads: (connect, read) timeout, size cap and overall read deadline
+        self.feed_timeout = (5, 15)
+        self.max_feed_bytes = 2 * 1024 * 1024
+        self.feed_read_deadline = 20
+        
+        # Article pages are only read until their description is found, up to this many bytes
+        self.max_description_bytes = 512 * 1024
+        
+        # Batched description enrichment: worker count, per-host limit and stage deadline in seconds
+        self.enrichment_workers = 8
+        self.max_enrichment_per_host = 2
+        self.enrichment_deadline = 30
+        self._enrichment_semaphores = {}
+        self._enrichment_lock = threading.Lock()
+        self._host_concurrency = {}
+        
+        # Blogs and feeds to scrape come from the declarative sources file,
+        # compiled once per process
+        self.registry = registry or get_source_registry()
+        self.blogs = self.registry.blogs()
+        
+        for blog in self.blogs:
+            self._configure_source(blog)
     
-    def scrape_all_blogs(self, days_back=7, max_articles_per_blog=3):
+    def scrape_all_blogs(self, days_back=7, max_articles_per_blog=3, concurrent=False, max_workers=4):
         """
         Scrape all configured AI company blogs
         
         Args:
             days_back (int): Only include articles published within this many days
             max_articles_per_blog (int): Maximum number of articles to include per blog
+            concurrent (bool): Scrape blogs in parallel using a bounded worker pool
+            max_workers (int): Maximum number of blogs scraped at the same time in concurrent mode
             
         Returns:
             list: List of article dictionaries
         """
         all_articles = []
         
-        # Get current date for filtering recent articles
-        current_date = datetime.now()
-        cutoff_date = current_date - timedelta(days=days_back)
+        if concurrent:
+            # Politeness delays are tracked per host, so blogs on different
+            # hosts can be fetched at the same time
+            logger.info(f"Scraping {len(self.blogs)} blogs concurrently with {max_workers} workers")
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    lambda blog: self._scrape_blog(blog, max_articles_per_blog),
+                    self.blogs
+                ))
+        else:
+            results = [self._scrape_blog(blog, max_articles_per_blog) for blog in self.blogs]
         
-        for blog in self.blogs:
-            logger.info(f"Scraping {blog['name']} blog at {blog['url']}")
+        # Keep the configured blog order regardless of completion order
+        for blog_articles in results:
+            all_articles.extend(blog_articles)
+        
+        all_articles = self._finish_articles(all_articles, days_back)
+        
+        logger.info(f"Scraped a total of {len(all_articles)} articles from all blogs")
+        return all_articles
+    
+    def scrape_source(self, blog, max_articles_per_blog=3, days_back=7, save_cache=True):
+        """
+        Scrape a single configured source, e.g. when a polling scheduler finds it due
+        
+        Args:
+            blog: Blog configuration dictionary from the source registry
+            max_articles_per_blog (int): Maximum number of articles to include
+            days_back (int): Only include articles published within this many days
+            save_cache (bool): Write the HTTP cache afterwards; callers scraping a batch
+                of sources pass False and call self.http_cache.save() once at the end
             
-            try:
-                # Add a random delay to avoid overloading servers
-                time.sleep(random.uniform(2, 5))
-                
-                # Try RSS feed first if available
-                if blog["use_rss"] and blog["rss_url"]:
-                    articles = self._scrape_rss_feed(blog, max_articles_per_blog)
-                    if articles:
-                        all_articles.extend(articles)
-                        logger.info(f"Added {len(articles)} articles from {blog['name']} RSS feed")
-                        continue
-                
-                # Fall back to HTML scraping if RSS fails or isn't available
-                # Use a session with cookies and referrer to appear more like a browser
-                session = requests.Session()
-                session.headers.update(self.headers)
-                session.headers.update({"Referer": "https://www.google.com/"})
-                
-                # Fetch the blog page
-                response = session.get(blog["url"], timeout=15)
-                response.raise_for_status()  # Raise exception for HTTP errors
-                
-                # Parse the HTML
-                soup = BeautifulSoup(response.content, "html.parser")
-                
-                # Find all article elements
-                article_elements = soup.select(blog["article_selector"])
-                logger.info(f"Found {len(article_elements)} article elements on {blog['name']} blog")
+        Returns:
+            list: List of article dictionaries
+        """
+        articles = self._scrape_blog(blog, max_articles_per_blog)
+        return self._finish_articles(articles, days_back, save_cache)
+    
+    def _finish_articles(self, articles, days_back, save_cache=True):
+        """
+        Filter scraped articles, fill in their descriptions and persist the HTTP cache
+        
+        Args:
+            articles (list): Raw articles from one or more listings
+            days_back (int): Only keep articles published within this many days
+            save_cache (bool): Write the HTTP cache to disk
+            
+        Returns:
+            list: Articles ready to be used downstream
+        """
+        # Drop stale and already handled articles before spending requests on their descriptions
+        articles = filter_recent(articles, days_back, self.date_normalizer)
+        if self.seen_index is not None:
+            articles = self.seen_index.filter_new(articles)
+        
+        self._enrich_descriptions(articles)
+        if save_cache:
+            self.http_cache.save()
+        return self._apply_description_fallbacks(articles)
+    
+    def _scrape_blog(self, blog, max_articles_per_blog):
+        """
+        Scrape a single blog, trying its RSS feed first and falling back to HTML
+        
+        Args:
+            blog: Blog configuration dictionary
+            max_articles_per_blog (int): Maximum number of articles to include
+            
+        Returns:
+            list: List of article dictionaries (empty on failure)
+        """
+        logger.info(f"Scraping {blog['name']} blog at {blog['url']}")
+        
+        try:
+            # Try RSS feed first if available
+            if blog["use_rss"] and blog["rss_url"]:
+                # Wait for the feed host's request budget to avoid overloading servers
+                self.rate_limiter.acquire(blog["rss_url"], check_robots=True)
+                articles = self._scrape_rss_feed(blog, max_articles_per_blog)
+                if articles is not None:
+                    logger.info(f"Added {len(articles)} articles from {blog['name']} RSS feed")
+                    return articles
+            
+            # Fall back to HTML scraping if RSS fails or isn't available
+            # Send a referrer to appear more like a browser
+            self.rate_limiter.acquire(blog["url"], check_robots=True)
+            response, cached_articles = self._fetch_listing(
+                blog["url"], self._browser_headers(), max_articles_per_blog, timeout=blog.get("timeout") or 15
+            )
+            if cached_articles is not None:
+                return cached_articles
+            
+            articles = self._parse_blog_listing(blog, response.content, max_articles_per_blog)
+            self.http_cache.store_response(blog["url"], response, articles, max_articles_per_blog)
+            return articles
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching {blog['name']} blog: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error scraping {blog['name']} blog: {str(e)}")
+        
+        return []
+    
+    async def scrape_all_blogs_async(self, days_back=7, max_articles_per_blog=3, async_fetcher=None):
+        """
+        Scrape all configured AI company blogs on the shared async fetch loop
+        
+        Args:
+            days_back (int): Only include articles published within this many days
+            max_articles_per_blog (int): Maximum number of articles to include per blog
+            async_fetcher (AsyncFetcher, optional): Fetcher to use, defaults to the shared one
+            
+        Returns:
+            list: List of article dictionaries
+        """
+        async_fetcher = async_fetcher or get_async_fetcher()
+        
+        results = await asyncio.gather(*(
+            self._scrape_blog_async(blog, max_articles_per_blog, async_fetcher)
+            for blog in self.blogs
+        ))
+        
+        # Keep the configured blog order regardless of completion order
+        all_articles = [article for blog_articles in results for article in blog_articles]
+        
+        # Enrichment blocks on its own worker pool, so keep it off the event loop
+        all_articles = await async_fetcher.run_blocking(self._finish_articles, all_articles, days_back)
+        
+        logger.info(f"Scraped a total of {len(all_articles)} articles from all blogs")
+        return all_articles
+    
+    async def _scrape_blog_async(self, blog, max_articles_per_blog, async_fetcher):
+        """
+        Async counterpart of _scrape_blog: network I/O goes through the fetch loop
+        and parsing runs in its worker threads
+        
+        Args:
+            blog: Blog configuration dictionary
+            max_articles_per_blog (int): Maximum number of articles to include
+            async_fetcher (AsyncFetcher): Fetcher to submit requests to
+            
+        Returns:
+            list: List of article dictionaries (empty on failure)
+        """
+        logger.info(f"Scraping {blog['name']} blog at {blog['url']}")
+        browser_headers = self._browser_headers()
+        
+        try:
+            # Try RSS feed first if available
+            if blog["use_rss"] and blog["rss_url"]:
+                await self.rate_limiter.acquire_async(blog["rss_url"], check_robots=True)
+                try:
+                    response, articles = await self._fetch_listing_async(
+                        async_fetcher, blog["rss_url"], self.headers, max_articles_per_blog,
+                        timeout=blog.get("timeout"), stream=True
+                    )
+                    if articles is None:
+                        articles = await async_fetcher.run_blocking(
+                            self._scrape_rss_feed, blog, max_articles_per_blog, response
+                        )
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Error fetching RSS feed for {blog['name']}: {str(e)}")
+                    articles = None
+                if articles is not None:
+                    logger.info(f"Added {len(articles)} articles from {blog['name']} RSS feed")
+                    return articles
+            
+            # Fall back to HTML scraping if RSS fails or isn't available
+            await self.rate_limiter.acquire_async(blog["url"], check_robots=True)
+            response, cached_articles = await self._fetch_listing_async(
+                async_fetcher, blog["url"], browser_headers, max_articles_per_blog, timeout=blog.get("timeout")
+            )
+            if cached_articles is not None:
+                return cached_articles
+            
+            articles = await async_fetcher.run_blocking(
+                self._parse_blog_listing, blog, response.content, max_articles_per_blog
+            )
+            self.http_cache.store_response(blog["url"], response, articles, max_articles_per_blog)
+            return articles
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Error fetching {blog['name']} blog: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error scraping {blog['name']} blog: {str(e)}")
+        
+        return []
+    
+    def _fetch_listing(self, url, headers, max_articles, timeout=15, stream=False):
+        """
+        Fetch a blog index or feed with a conditional GET
+        
+        Args:
+            url (str): URL of the page or feed
+            headers (dict): Request headers
+            max_articles (int): Number of articles the caller wants
+            timeout: Request timeout in seconds, or a (connect, read) tuple
+            stream (bool): Return before the body is downloaded; the caller must read and close it
+            
+        Returns:
+            tuple: (response, cached_articles); cached_articles is None unless the server answered 304
+        """
+        conditional_headers = self.http_cache.conditional_headers(url, max_articles)
+        response = self.session.get(url, headers=dict(headers, **conditional_headers), timeout=timeout, stream=stream)
+        
+        if response.status_code == 304:
+            response.close()
+            cached_articles = self.http_cache.get_articles(url, max_articles)
+            if cached_articles is not None:
+                return response, cached_articles
+            # Nothing to reuse, so ask again without validators
+            response = self.session.get(url, headers=headers, timeout=timeout, stream=stream)
+        
+        self.rate_limiter.observe(response)
+        response.raise_for_status()  # Raise exception for HTTP errors
+        return response, None
+    
+    async def _fetch_listing_async(self, async_fetcher, url, headers, max_articles, timeout=None, stream=False):
+        """
+        Async counterpart of _fetch_listing using the shared fetch loop
+        
+        Returns:
+            tuple: (response, cached_articles); cached_articles is None unless the server answered 304
+        """
+        conditional_headers = self.http_cache.conditional_headers(url, max_articles)
+        response = await async_fetcher.fetch(
+            url, timeout=timeout, headers=dict(headers, **conditional_headers), stream=stream
+        )
+        
+        if response.status_code == 304:
+            response.close()
+            cached_articles = self.http_cache.get_articles(url, max_articles)
+            if cached_articles is not None:
+                return response, cached_articles
+            # Nothing to reuse, so ask again without validators
+            response = await async_fetcher.fetch(url, timeout=timeout, headers=headers, stream=stream)
+        
+        self.rate_limiter.observe(response)
+        response.raise_for_status()  # Raise exception for HTTP errors
+        return response, None
+    
+    def _read_feed_entries(self, response, blog, max_articles):
+        """
+        Parse feed entries from a streamed response as the bytes arrive
+        
+        Downloading stops as soon as enough entries are parsed, or when the
+        size cap or time budget is hit, and the connection is always closed,
+        so a huge or trickling feed can't stall the run. Feeds that aren't
+        well-formed XML fall back to feedparser when it is installed.
+        
+        Args:
+            response: Streamed requests.Response for the feed
+            blog: Blog configuration dictionary
+            max_articles (int): Number of entries needed
+            
+        Returns:
+            list: Entry dictionaries with title, link, published and summary keys
+        """
+        parser = FeedEntryParser(max_articles)
+        chunks = []
+        total_bytes = 0
+        started = time.monotonic()
+        parse_error = None
+        
+        try:
+            for chunk in response.iter_content(chunk_size=16384):
+                chunks.append(chunk)
+                total_bytes += len(chunk)
                 
-                # Process each article
-                blog_articles = []
-                for article_elem in article_elements:
+                if parse_error is None:
                     try:
-                        # Extract article details
-                        article_data = self._extract_article_data(article_elem, blog)
-                        
-                        if article_data:
-                            blog_articles.append(article_data)
-                            
-                            # Stop if we've reached the maximum number of articles for this blog
-                            if len(blog_articles) >= max_articles_per_blog:
-                                break
-                    except Exception as e:
-                        logger.error(f"Error processing article from {blog['name']}: {str(e)}")
-                
-                # Add articles from this blog to the overall list
-                all_articles.extend(blog_articles)
-                logger.info(f"Added {len(blog_articles)} articles from {blog['name']}")
+                        if parser.feed(chunk):
+                            # Enough entries, skip the rest of the document
+                            return parser.entries
+                    except ET.ParseError as e:
+                        # Keep downloading so feedparser gets the whole document
+                        parse_error = e
                 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Error fetching {blog['name']} blog: {str(e)}")
+                if total_bytes >= self.max_feed_bytes:
+                    logger.warning(f"RSS feed for {blog['name']} exceeds {self.max_feed_bytes} bytes, truncating")
+                    return parser.entries
+                if time.monotonic() - started > self.feed_read_deadline:
+                    logger.warning(f"RSS feed for {blog['name']} took over {self.feed_read_deadline}s to download, truncating")
+                    return parser.entries
+            
+            if parse_error is None:
+                try:
+                    return parser.close()
+                except ET.ParseError as e:
+                    parse_error = e
+        finally:
+            response.close()
+        
+        if parser.entries:
+            return parser.entries
+        
+        logger.warning(f"Could not parse RSS feed for {blog['name']} incrementally ({parse_error}), falling back to feedparser")
+        return self._parse_feed_with_feedparser(b"".join(chunks), max_articles)
+    
+    def _parse_feed_with_feedparser(self, content, max_articles):
+        """
+        Parse a feed that isn't well-formed XML with the lenient feedparser library
+        
+        Args:
+            content (bytes): Feed document
+            max_articles (int): Number of entries needed
+            
+        Returns:
+            list: Entry dictionaries with title, link, published and summary keys
+        """
+        try:
+            import feedparser
+        except ImportError:
+            logger.warning("feedparser library not installed. Install with: pip install feedparser")
+            return []
+        
+        feed = feedparser.parse(content)
+        return [
+            {
+                "title": html_to_text(entry.get("title", "")),
+                "link": entry.get("link", ""),
+                "published": entry.get("published") or entry.get("updated") or "",
+                "summary": html_to_text(entry.get("summary") or entry.get("description") or "")
+            }
+            for entry in feed.entries[:max_articles]
+        ]
+    
+    def _parse_blog_listing(self, blog, content, max_articles_per_blog):
+        """
+        Extract articles from a downloaded blog index page
+        
+        Args:
+            blog: Blog configuration dictionary
+            content (bytes): Raw HTML of the blog page
+            max_articles_per_blog (int): Maximum number of articles to include
+            
+        Returns:
+            list: List of article dictionaries
+        """
+        # Parse the HTML with the blog's backend. If that backend can't handle
+        # one of the blog's selectors, either by failing or by missing titles,
+        # links or dates that the selectors should find, the page is parsed
+        # again with html.parser and the more complete result is used
+        backend = self._backend_for(blog)
+        try:
+            blog_articles, problems = self._extract_listing(blog, backend.parse(content), max_articles_per_blog)
+        except Exception as e:
+            if backend.name == "html.parser":
+                raise
+            logger.warning(f"'{backend.name}' backend failed on {blog['name']} blog ({str(e)}), retrying with html.parser")
+            blog_articles, problems = None, None
+        
+        if problems and backend.name != "html.parser":
+            if blog_articles is not None:
+                logger.warning(f"'{backend.name}' backend missed {problems} titles, links or dates on "
+                               f"{blog['name']} blog, retrying with html.parser")
+            fallback_articles, fallback_problems = self._extract_listing(
+                blog, get_parser_backend("html.parser").parse(content), max_articles_per_blog
+            )
+            if blog_articles is None or fallback_problems < problems:
+                blog_articles = fallback_articles
+        
+        logger.info(f"Added {len(blog_articles)} articles from {blog['name']}")
+        return blog_articles
+    
+    def _extract_listing(self, blog, document, max_articles_per_blog):
+        """
+        Extract the articles from a parsed blog index page
+        
+        Args:
+            blog: Blog configuration dictionary
+            document: Parsed page from an HTML parser backend
+            max_articles_per_blog (int): Maximum number of articles to include
+            
+        Returns:
+            tuple: (article dictionaries, number of examined article elements whose
+                title, link or configured date couldn't be extracted)
+        """
+        article_elements = document.select(blog["article_selector"])
+        logger.info(f"Found {len(article_elements)} article elements on {blog['name']} blog")
+        
+        # Process each article
+        blog_articles = []
+        problems = 0
+        for article_elem in article_elements:
+            try:
+                # Extract article details
+                article_data = self._extract_article_data(article_elem, blog)
             except Exception as e:
-                logger.error(f"Unexpected error scraping {blog['name']} blog: {str(e)}")
+                logger.error(f"Error processing article from {blog['name']}: {str(e)}")
+                problems += 1
+                continue
+            
+            if not article_data:
+                problems += 1
+                continue
+            if not article_data["publishedAt"]:
+                if blog["date_selector"]:
+                    problems += 1
+                article_data["publishedAt"] = datetime.now().strftime("%Y-%m-%d")
+            
+            # Listings are newest first, so everything after a known article is known too
+            if self._is_seen(article_data):
+                logger.info(f"Reached an article already seen on {blog['name']} blog, stopping")
+                break
+            
+            blog_articles.append(article_data)
+            
+            # Stop if we've reached the maximum number of articles for this blog
+            if len(blog_articles) >= max_articles_per_blog:
+                break
         
-        logger.info(f"Scraped a total of {len(all_articles)} articles from all blogs")
-        return all_articles
+        return blog_articles, problems
+    
+    def _is_seen(self, article):
+        """Check whether a previous run already handled an article"""
+        return self.seen_index is not None and self.seen_index.is_seen(article)
+    
+    def _backend_for(self, blog):
+        """Return the HTML parser backend for a blog, honouring its optional "parser_backend" setting"""
+        name = blog.get("parser_backend")
+        if not name:
+            return self.parser_backend
+        if name not in self._blog_backends:
+            self._blog_backends[name] = get_parser_backend(name)
+        return self._blog_backends[name]
+    
+    def _browser_headers(self):
+        """Return the request headers with a search-engine referrer added"""
+        return dict(self.headers, Referer="https://www.google.com/")
     
-    def _scrape_rss_feed(self, blog, max_articles):
+    def _configure_source(self, blog):
+        """Apply a blog's "rate_limit" and "concurrency" settings to the hosts it is served from"""
+        hosts = {urlparse(url).netloc.lower() for url in (blog["url"], blog["rss_url"], blog["base_url"]) if url}
+        rate_limit = blog.get("rate_limit")
+        for host in hosts:
+            if rate_limit:
+                self.rate_limiter.configure_host(host, rate=rate_limit.get("rate"), burst=rate_limit.get("burst"))
+            self._host_concurrency[host] = blog.get("concurrency") or self.max_enrichment_per_host
+    
+    def _feed_timeout(self, blog):
+        """(connect, read) timeout for a blog's feed, using the blog's own timeout for reads"""
+        connect_timeout, read_timeout = self.feed_timeout
+        return (connect_timeout, blog.get("timeout") or read_timeout)
+    
+    def _scrape_rss_feed(self, blog, max_articles, response=None):
         """
         Scrape articles from an RSS feed
         
         Args:
             blog: Blog configuration dictionary
             max_articles: Maximum number of articles to retrieve
+            response (optional): Streamed response for the feed; fetched from rss_url if omitted
             
         Returns:
-            list: List of article dictionaries
+            list: List of article dictionaries, empty if the feed has nothing new,
+                or None if the feed couldn't be used and the HTML page should be scraped instead
         """
         try:
-            import feedparser
+            if response is None:
+                # Download through the pooled, cache-aware session with explicit timeouts
+                logger.info(f"Attempting to fetch RSS feed for {blog['name']} from {blog['rss_url']}")
+                response, cached_articles = self._fetch_listing(
+                    blog['rss_url'], self.headers, max_articles, timeout=self._feed_timeout(blog), stream=True
+                )
+                if cached_articles is not None:
+                    return cached_articles
             
-            logger.info(f"Attempting to fetch RSS feed for {blog['name']} from {blog['rss_url']}")
-            feed = feedparser.parse(blog['rss_url'])
+            entries = self._read_feed_entries(response, blog, max_articles)
             
-            if not feed.entries:
+            if not entries:
                 logger.warning(f"No entries found in RSS feed for {blog['name']}")
-                return []
+                return None
             
             articles = []
-            for entry in feed.entries[:max_articles]:
-                try:
-                    title = entry.title
-                    url = entry.link
-                    
-                    # Try to get published date
-                    if hasattr(entry, 'published'):
-                        date_str = entry.published
-                    elif hasattr(entry, 'updated'):
-                        date_str = entry.updated
-                    else:
-                        date_str = datetime.now().strftime("%Y-%m-%d")
-                    
-                    # Try to get description
-                    if hasattr(entry, 'summary'):
-                        description = entry.summary
-                    elif hasattr(entry, 'description'):
-                        description = entry.description
-                    else:
-                        description = f"Latest from {blog['name']}: {title}"
-                    
-                    # Clean up HTML from description
-                    if description:
-                        soup = BeautifulSoup(description, 'html.parser')
-                        description = soup.get_text()
-                    
-                    article_data = {
-                        "source": {"name": blog["name"]},
-                        "title": title,
-                        "url": url,
-                        "publishedAt": date_str,
-                        "description": description
-                    }
-                    
-                    articles.append(article_data)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing RSS entry for {blog['name']}: {str(e)}")
+            for entry in entries:
+                title = entry["title"]
+                url = entry["link"]
+                if not title or not url:
+                    logger.error(f"Skipping RSS entry without title or link for {blog['name']}")
+                    continue
+                
+                article_data = {
+                    "source": {"name": blog["name"]},
+                    "title": title,
+                    "url": url,
+                    "publishedAt": entry["published"] or datetime.now().strftime("%Y-%m-%d"),
+                    "description": entry["summary"] or f"Latest from {blog['name']}: {title}"
+                }
+                
+                # Feeds list newest first, so everything after a known entry is known too
+                if self._is_seen(article_data):
+                    logger.info(f"Reached an article already seen in {blog['name']} RSS feed, stopping")
+                    break
+                
+                articles.append(article_data)
+            
+            logger.info(f"Retrieved {len(articles)} new articles from {blog['name']} RSS feed")
             
-            logger.info(f"Retrieved {len(articles)} articles from {blog['name']} RSS feed")
+            self.http_cache.store_response(blog['rss_url'], response, articles, max_articles)
             return articles
             
-        except ImportError:
-            logger.warning("feedparser library not installed. Install with: pip install feedparser")
-            return []
         except Exception as e:
             logger.error(f"Error fetching RSS feed for {blog['name']}: {str(e)}")
-            return []
+            return None
     
     def _extract_article_data(self, article_elem, blog):
         """
         Extract article data from an article element
         
         Args:
-            article_elem: BeautifulSoup element for the article
+            article_elem: Parsed element for the article (BeautifulSoup Tag or SelectolaxElement)
             blog: Blog configuration dictionary
             
         Returns:
-            dict: Article data or None if extraction failed
+            dict: Article data (publishedAt None if no date was found) or None if extraction failed
         """
         # Extract title
         if blog["title_selector"]:
@@ -305,24 +667,81 @@ class AIBlogScraperImproved:
             desc_elem = article_elem.select_one(blog["description_selector"])
             description = desc_elem.text.strip() if desc_elem else None
         
-        # If no description found, try to fetch it from the article page
-        if not description and url:
-            try:
-                description = self._fetch_description_from_article(url)
-            except Exception as e:
-                logger.warning(f"Could not fetch description from article URL: {str(e)}")
-        
-        # Format as a news article
+        # Format as a news article; a missing description stays None here and
+        # is filled in by the batched enrichment stage
         article_data = {
             "source": {"name": blog["name"]},
             "title": title,
             "url": url,
-            "publishedAt": date_str or datetime.now().strftime("%Y-%m-%d"),
-            "description": description or f"Latest from {blog['name']}: {title}"
+            "publishedAt": date_str or None,
+            "description": description
         }
         
         return article_data
     
+    def _enrich_descriptions(self, articles, deadline=None):
+        """
+        Fetch missing descriptions for a batch of articles concurrently
+        
+        Articles are updated in place, so descriptions found here are also
+        kept in the HTTP cache entries that reference the same dictionaries.
+        Each host allows at most its source's "concurrency" fetches at once
+        (max_enrichment_per_host for unconfigured hosts), and
+        articles still pending when the deadline passes keep no description.
+        
+        Args:
+            articles (list): Article dictionaries, some with description None
+            deadline (float, optional): Time budget for the stage in seconds, defaults to self.enrichment_deadline
+        """
+        missing = [article for article in articles if not article.get("description")]
+        if not missing:
+            return
+        
+        deadline = deadline or self.enrichment_deadline
+        logger.info(f"Fetching descriptions for {len(missing)} articles")
+        
+        executor = ThreadPoolExecutor(max_workers=min(len(missing), self.enrichment_workers))
+        futures = {
+            executor.submit(self._fetch_description_limited, article["url"]): article
+            for article in missing
+        }
+        try:
+            for future in as_completed(futures, timeout=deadline):
+                article = futures[future]
+                try:
+                    description = future.result()
+                except Exception as e:
+                    logger.warning(f"Could not fetch description from article URL: {str(e)}")
+                    continue
+                if description:
+                    article["description"] = description
+        except FuturesTimeoutError:
+            pending = sum(1 for future in futures if not future.done())
+            logger.warning(f"Description enrichment deadline of {deadline}s reached, {pending} articles skipped")
+        finally:
+            # Don't wait for stragglers past the deadline
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _fetch_description_limited(self, url):
+        """Fetch an article description while holding the article host's concurrency slot"""
+        host = urlparse(url).netloc.lower()
+        with self._enrichment_lock:
+            semaphore = self._enrichment_semaphores.setdefault(
+                host, threading.BoundedSemaphore(self._host_concurrency.get(host, self.max_enrichment_per_host))
+            )
+        with semaphore:
+            return self._fetch_description_from_article(url)
+    
+    def _apply_description_fallbacks(self, articles):
+        """Return copies of the articles with a generic description where none was found"""
+        return [
+            article if article.get("description") else dict(
+                article,
+                description=f"Latest from {article['source']['name']}: {article['title']}"
+            )
+            for article in articles
+        ]
+    
     def _fetch_description_from_article(self, url):
         """
         Fetch the description from an article page
@@ -333,30 +752,19 @@ class AIBlogScraperImproved:
         Returns:
             str: Article description or None
         """
-        # Add a small delay to avoid overloading servers
-        time.sleep(random.uniform(1, 2))
+        # Article pages share their host's request budget with the listing
+        self.rate_limiter.acquire(url, check_robots=True)
         
-        # Use a session with cookies and referrer to appear more like a browser
-        session = requests.Session()
-        session.headers.update(self.headers)
-        session.headers.update({"Referer": "https://www.google.com/"})
-        
-        response = session.get(url, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, "html.parser")
-        
-        # Try meta description first
-        meta_desc = soup.select_one("meta[name='description']")
-        if meta_desc and meta_desc.get("content"):
-            return meta_desc.get("content")
-        
-        # Try first paragraph
-        first_p = soup.select_one("article p, .article p, .post p, .content p")
-        if first_p:
-            return first_p.text.strip()
+        # Stream the page and stop reading as soon as a description turns up
+        response = self.session.get(url, headers=self._browser_headers(), timeout=10, stream=True)
+        self.rate_limiter.observe(response)
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            response.close()
+            raise
         
-        return None
+        return extract_description(response, max_bytes=self.max_description_bytes)
     
     def save_articles_to_file(self, articles, filename="latest_ai_news.json"):
         """
@@ -395,15 +803,8 @@ class AIBlogScraperImproved:
                 # Combine the articles
                 combined_articles = scraped_articles + newsapi_articles
                 
-                # Remove duplicates based on URL
-                seen_urls = set()
-                unique_articles = []
-                
-                for article in combined_articles:
-                    url = article.get("url")
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        unique_articles.append(article)
+                # Remove duplicates (same URL or same story)
+                unique_articles = dedupe_articles(combined_articles)
                 
                 logger.info(f"Combined {len(scraped_articles)} scraped articles with {len(newsapi_articles)} NewsAPI articles, resulting in {len(unique_articles)} unique articles")
                 return unique_articles
@@ -423,10 +824,10 @@ if __name__ == "__main__":
         # Check for feedparser
         try:
             import feedparser
-            logger.info("feedparser is installed, RSS feeds will be used when available")
+            logger.info("feedparser is installed, it will be used for feeds that aren't well-formed XML")
         except ImportError:
             logger.warning("feedparser is not installed. Install with: pip install feedparser")
-            logger.warning("RSS feeds will not be used, falling back to HTML scraping")
+            logger.warning("Feeds that aren't well-formed XML will fall back to HTML scraping")
         
         # Create scraper instance
         scraper = AIBlogScraperImproved()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Async Fetch Layer for AI News Automation
+
+This module runs a single background asyncio event loop that both the
+NewsAPI fetcher and the blog scraper submit HTTP requests to, so their
+network waits overlap instead of adding up. Requests are limited per host
+and bounded by a timeout, and sync wrappers let the existing run scripts
+drive coroutines without managing an event loop themselves.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+
+from http_session import get_session
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('async_fetcher')
+
+class AsyncFetcher:
+    """Class to run HTTP requests concurrently on a shared background event loop"""
+
+    def __init__(self, max_per_host=4, timeout=15, max_workers=16, host_limits=None, session=None):
+        """
+        Initialize the fetcher and start its event loop thread
+
+        Args:
+            max_per_host (int): Default maximum number of in-flight requests per host
+            timeout (float): Default total timeout for a single request, in seconds
+            max_workers (int): Number of worker threads used for blocking I/O and parsing
+            host_limits (dict, optional): Per-host overrides of max_per_host, keyed by hostname
+            session (requests.Session, optional): HTTP session to use, defaults to the shared pooled session
+        """
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.host_limits = {host.lower(): limit for host, limit in (host_limits or {}).items()}
+        self.session = session or get_session()
+
+        # requests is blocking, so the actual I/O runs in a thread pool owned by the loop
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="async-fetch")
+        self._host_semaphores = {}
+
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(self._executor)
+        self._thread = threading.Thread(target=self._run_loop, name="async-fetch-loop", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        """Run the event loop forever in the background thread"""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def _semaphore_for(self, url):
+        """Return the concurrency semaphore for the URL's host (event loop thread only)"""
+        host = urlparse(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.host_limits.get(host, self.max_per_host))
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def fetch(self, url, method="GET", timeout=None, **kwargs):
+        """
+        Perform an HTTP request under the host's concurrency limit
+
+        Args:
+            url (str): URL to request
+            method (str): HTTP method
+            timeout (float, optional): Total timeout in seconds, defaults to self.timeout
+            **kwargs: Extra arguments passed to requests (headers, params, ...)
+
+        Returns:
+            requests.Response: The response
+
+        Raises:
+            requests.exceptions.Timeout: If the request does not finish within the timeout
+        """
+        timeout = timeout or self.timeout
+
+        async with self._semaphore_for(url):
+            try:
+                # requests' own timeout bounds each socket operation, wait_for bounds the total
+                return await asyncio.wait_for(
+                    self.run_blocking(self.session.request, method, url, timeout=timeout, **kwargs),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                raise requests.exceptions.Timeout(f"Request to {url} timed out after {timeout} seconds")
+
+    async def run_blocking(self, func, *args, **kwargs):
+        """
+        Run a blocking function in the fetcher's thread pool
+
+        Args:
+            func: Callable to run
+            *args, **kwargs: Arguments for the callable
+
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def submit(self, coro):
+        """
+        Schedule a coroutine on the shared event loop
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            concurrent.futures.Future: Future for the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro, timeout=None):
+        """
+        Run a coroutine on the shared event loop and wait for its result
+
+        This is the sync wrapper used by the run scripts.
+
+        Args:
+            coro: Coroutine to run
+            timeout (float, optional): Maximum number of seconds to wait
+
+        Returns:
+            The coroutine's result
+        """
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("AsyncFetcher.run() cannot be called from the fetcher's own event loop")
+        return self.submit(coro).result(timeout)
+
+    def run_all(self, *coros, timeout=None):
+        """
+        Run several coroutines concurrently and wait for all of them
+
+        Args:
+            *coros: Coroutines to run
+            timeout (float, optional): Maximum number of seconds to wait
+
+        Returns:
+            list: Results in the same order as the coroutines
+        """
+        async def gather():
+            return await asyncio.gather(*coros)
+
+        return self.run(gather(), timeout=timeout)
+
+    def close(self):
+        """Stop the event loop and shut down the worker threads"""
+        if self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+        self._executor.shutdown(wait=False)
+
+
+_shared_fetcher = None
+_shared_fetcher_lock = threading.Lock()
+
+def get_async_fetcher():
+    """
+    Get the process-wide AsyncFetcher, creating it on first use
+
+    Returns:
+        AsyncFetcher: Shared fetcher instance
+    """
+    global _shared_fetcher
+    with _shared_fetcher_lock:
+        if _shared_fetcher is None:
+            _shared_fetcher = AsyncFetcher()
+            logger.info("Started shared async fetch loop")
+        return _shared_fetcher
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        fetcher = get_async_fetcher()
+
+        urls = [
+            "https://openai.com/blog",
+            "https://www.anthropic.com/news",
+            "https://huggingface.co/blog"
+        ]
+
+        async def fetch_status(url):
+            try:
+                response = await fetcher.fetch(url)
+                return response.status_code
+            except requests.exceptions.RequestException as e:
+                return str(e)
+
+        statuses = fetcher.run_all(*(fetch_status(url) for url in urls))
+        for url, status in zip(urls, statuses):
+            print(f"{url}: {status}")
+
+        fetcher.close()
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
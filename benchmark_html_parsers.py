@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+HTML Parser Backend Benchmark for AI News Automation
+
+This script downloads each configured blog index page once and then times
+every installed HTML parser backend on it: parsing the page and running the
+blog's article selector. Pages can also be read from local files so runs are
+repeatable offline.
+
+Usage:
+    python benchmark_html_parsers.py                 # fetch the configured blog pages
+    python benchmark_html_parsers.py page1.html ...  # benchmark saved pages
+"""
+
+import sys
+import time
+import logging
+
+from ai_blog_scraper_improved import AIBlogScraperImproved
+from html_backend import available_backends, get_parser_backend
+
+# Set up logging
+logging.basicConfig(
+    level=logging.WARNING,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('benchmark_html_parsers')
+
+def load_pages(paths):
+    """
+    Load the pages to benchmark
+
+    Args:
+        paths (list): Local HTML files; the configured blog pages are fetched when empty
+
+    Returns:
+        list: (label, article_selector, content) tuples
+    """
+    scraper = AIBlogScraperImproved()
+
+    if paths:
+        # Saved pages have no blog config, so only the parse itself is meaningful
+        pages = []
+        for path in paths:
+            with open(path, 'rb') as f:
+                pages.append((path, "a", f.read()))
+        return pages
+
+    pages = []
+    for blog in scraper.blogs:
+        try:
+            response = scraper.session.get(blog["url"], headers=scraper._browser_headers(), timeout=15)
+            response.raise_for_status()
+            pages.append((blog["name"], blog["article_selector"], response.content))
+        except Exception as e:
+            logger.warning(f"Skipping {blog['name']}: {str(e)}")
+    return pages
+
+def time_backend(backend, selector, content, repeat):
+    """
+    Time parsing a page and running a selector on it
+
+    Returns:
+        tuple: (average milliseconds per run, number of matched elements)
+    """
+    matches = 0
+    started = time.perf_counter()
+    for _ in range(repeat):
+        matches = len(backend.parse(content).select(selector))
+    elapsed = time.perf_counter() - started
+    return elapsed / repeat * 1000, matches
+
+def run_benchmark(paths, repeat=5):
+    """Run the benchmark and print a table of parse times per page and backend"""
+    pages = load_pages(paths)
+    if not pages:
+        print("No pages to benchmark")
+        return
+
+    backends = [get_parser_backend(name) for name in available_backends()]
+    print(f"Backends: {', '.join(backend.name for backend in backends)} ({repeat} runs each)\n")
+
+    header = f"{'Page':<20} {'KB':>8}" + "".join(f" {backend.name:>18}" for backend in backends)
+    print(header)
+    print("-" * len(header))
+
+    for label, selector, content in pages:
+        row = f"{label[:20]:<20} {len(content) / 1024:>8.0f}"
+        for backend in backends:
+            try:
+                ms, matches = time_backend(backend, selector, content, repeat)
+                row += f" {f'{ms:.1f} ms ({matches})':>18}"
+            except Exception as e:
+                logger.warning(f"{backend.name} failed on {label}: {str(e)}")
+                row += f" {'error':>18}"
+        print(row)
+
+    print("\nValues are average parse + select time per page, with the number of matched article elements.")
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1:])
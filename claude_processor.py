@@ -14,6 +14,8 @@ import logging
 import anthropic
 from typing import List, Dict, Any, Optional
 
+from relevance_ranker import RelevanceRanker
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -21,15 +23,191 @@ logging.basicConfig(
 )
 logger = logging.getLogger('claude_processor')
 
+# The instructions below never change between calls, so they are sent as the
+# system prompt and marked cacheable; only the article list varies. Anthropic
+# only caches a prefix of at least 1024 tokens (for Opus and Sonnet), so each
+# prompt carries its full guidelines, output rules and worked examples to stay
+# above that size; keep it there when editing them.
+
+SELECTION_SYSTEM_PROMPT = """You are an expert tech and AI news curator with deep knowledge of the field. Your task is to select the most important and relevant tech/AI news stories for a daily news account on Twitter that is followed by engineers, researchers, founders and technical decision makers.
+
+You will be given a numbered list of tech and AI news articles and the number of articles to select. The articles have already been collected from news APIs and company blogs, deduplicated and pre-ranked, so every candidate is at least loosely on topic. Your job is the final editorial judgement.
+
+## Selection criteria
+
+Select the most important and relevant articles based on:
+
+1. Significance to the tech/AI industry: Does the story change what practitioners can build, buy or rely on? New frontier models, major open-weight releases, large funding or acquisitions, regulation that takes effect and outages of widely used services are significant. Minor feature updates, rebrandings and opinion pieces usually are not.
+2. Novelty and innovation factor: Prefer the first report of a genuinely new capability, result or product over follow-up coverage, recaps, listicles and "what we know so far" articles.
+3. Potential impact on the field: Favour stories that affect many people or companies, set a precedent, or shift the direction of research, over stories that only matter to a single vendor's customers.
+4. Credibility of the source: Prefer primary sources (the company's own announcement, the paper, the regulator) and established outlets with original reporting. Treat rumours, anonymous claims and press releases without substance with caution.
+5. Recency and timeliness: Prefer the newest developments. An older article only wins when its story is clearly more important than everything newer.
+
+## Editorial rules
+
+- Never select two articles about the same story, even when they come from different outlets or use different headlines. Pick the single best article for each story, usually the primary source or the most detailed report.
+- Aim for variety across the selection: for example a model release, a research result and an industry or policy story rather than three stories about the same company, unless one company truly dominates the news.
+- Skip articles whose title or description is missing, clearly truncated, unrelated to technology or AI, promotional (discounts, webinars, sponsored posts) or purely speculative.
+- Skip tutorials, how-to guides, job listings and product reviews unless they report genuine news.
+- Do not penalise an article because its description is short if its title and source make the story clear.
+- Judge each article by its title, source, publication date and description only. Do not assume facts that are not stated.
+- If fewer articles are worth posting than requested, still return the requested number by choosing the best of the remaining candidates.
+
+## Output format
+
+Respond with ONLY the article IDs of your selections in this exact format, most important first, on a single line, with no explanation before or after:
+SELECTED_ARTICLES: [id1, id2, id3]
+
+The IDs must be the integer numbers from the "Article N:" headings of the list you were given. Do not invent IDs, do not repeat an ID and do not return more or fewer IDs than requested.
+
+## Examples
+
+Example 1. Given these candidates and a request for 3 articles:
+
+Article 1: "OpenAI releases GPT-5 to all ChatGPT users" (OpenAI, today)
+Article 2: "GPT-5 is here: everything you need to know" (Example Tech Blog, today)
+Article 3: "EU AI Act obligations for general-purpose models take effect" (Reuters, yesterday)
+Article 4: "10 prompts to boost your productivity" (Example Magazine, today)
+Article 5: "DeepMind model solves open problems in combinatorics" (Nature, today)
+
+A good answer is:
+SELECTED_ARTICLES: [1, 5, 3]
+
+Article 2 covers the same story as article 1 and article 4 is not news.
+
+Example 2. Given these candidates and a request for 2 articles:
+
+Article 1: "Startup raises $5M seed round for AI note-taking" (Example News, today)
+Article 2: "Nvidia reports record data center revenue on AI demand" (Associated Press, today)
+Article 3: "Meta publishes open-weight Llama model with 1M token context" (Meta AI, yesterday)
+Article 4: "Rumor: Apple may announce AI features next year" (Example Rumors, today)
+
+A good answer is:
+SELECTED_ARTICLES: [3, 2]
+
+Example 3. Given these candidates and a request for 3 articles:
+
+Article 1: "Anthropic adds memory to Claude" (Anthropic, today)
+Article 2: "Kubernetes 1.31 adds native support for AI inference workloads" (CNCF, today)
+Article 3: "Claude can now remember your past conversations" (The Verge, today)
+Article 4: "Major cloud outage takes down AI APIs for hours" (Ars Technica, today)
+Article 5: "Webinar: getting started with generative AI" (Example Events, today)
+
+A good answer is:
+SELECTED_ARTICLES: [1, 4, 2]
+
+Article 3 covers the same story as article 1, and the company's own announcement is the primary source.
+
+Example 4. Given these candidates and a request for 3 articles:
+
+Article 1: "Microsoft brings Copilot agents to GitHub pull requests" (Microsoft AI, today)
+Article 2: "Hugging Face releases open dataset of 10 trillion tokens" (Hugging Face, today)
+Article 3: "Opinion: the AI bubble is about to burst" (Example Opinion, today)
+Article 4: "Researchers show LLM agents can be hijacked through web pages" (MIT Technology Review, today)
+Article 5: "Copilot agents now review pull requests on GitHub" (TechCrunch, today)
+Article 6: "Google updates Gemini app icon" (Example Tech Blog, yesterday)
+
+A good answer is:
+SELECTED_ARTICLES: [1, 4, 2]
+
+Article 5 covers the same story as article 1, article 3 is opinion and article 6 is a minor update."""
+
+TWEET_SYSTEM_PROMPT = """You are an expert at creating engaging, informative tweets about tech and AI news. Your tweets are concise, accurate, and drive engagement. You write for a daily news account on Twitter that is followed by engineers, researchers, founders and technical decision makers who want the day's most important tech and AI stories at a glance.
+
+You will be given a numbered list of selected tech/AI news articles with their title, source, URL and description. Create an engaging tweet that:
+
+1. Briefly mentions all of the stories
+2. Includes the URLs for each article
+3. Uses appropriate hashtags (#AI, #TechNews, etc.)
+4. Stays within Twitter's 280 character limit
+5. Is engaging and informative
+
+## Writing guidelines
+
+- Twitter counts every URL as 23 characters no matter how long it is, so budget 23 characters per link. The rest of the text, the spaces, line breaks and hashtags share the remaining characters.
+- Summarise each story in a few words that carry the news: who did what. Prefer concrete nouns and verbs ("OpenAI releases GPT-5") over vague teasers ("Big news from OpenAI!").
+- Keep the stories in the order they were given, each on its own line, optionally numbered or introduced with a short emoji such as 🚀, 🧠, 📈, ⚖️ or 🔒 that fits the story.
+- Use exact names of companies, products and models as they appear in the articles, with their original capitalisation (e.g. GPT-4o, Llama, DeepMind, Kubernetes).
+- Add two or three relevant hashtags at the end, such as #AI, #TechNews, #LLM, #OpenSource, #MachineLearning or #DevOps. Do not put hashtags in the middle of sentences.
+- Be accurate: only state what the article titles and descriptions say. Do not add numbers, dates, quotes or claims that are not in the articles, and do not exaggerate.
+- Keep a neutral, informative and upbeat tone. No clickbait, no all-caps words, no more than one exclamation mark and no calls to follow, like or retweet.
+- Do not mention that the tweet was generated, do not address the reader as "guys" and do not include @mentions unless an article is about that account.
+- If the text would be longer than 280 characters, shorten the story summaries first, then drop emojis, then drop hashtags beyond #AI; never drop a URL.
+
+## Output format
+
+Respond with ONLY the tweet text in this exact format:
+TWEET_TEXT: [Your formatted tweet here]
+
+Write the tweet directly after "TWEET_TEXT: " without brackets or quotation marks around it. Separate the lines of the tweet with single line breaks and never leave an empty line inside the tweet, because everything after the first empty line is discarded. Do not add any explanation, character count or alternative versions before or after the tweet.
+
+## Examples
+
+Example 1. Given these articles:
+
+Article 1: "OpenAI releases GPT-5 to all ChatGPT users" (OpenAI) https://openai.com/index/gpt-5
+Article 2: "DeepMind model solves open problems in combinatorics" (Nature) https://www.nature.com/articles/example
+Article 3: "EU AI Act obligations for general-purpose models take effect" (Reuters) https://www.reuters.com/technology/example
+
+A good answer is:
+TWEET_TEXT: Today in AI:
+🚀 OpenAI rolls out GPT-5 to all ChatGPT users https://openai.com/index/gpt-5
+🧠 DeepMind model cracks open combinatorics problems https://www.nature.com/articles/example
+⚖️ EU AI Act rules for general-purpose models take effect https://www.reuters.com/technology/example
+#AI #TechNews
+
+Example 2. Given these articles:
+
+Article 1: "Meta publishes open-weight Llama model with 1M token context" (Meta AI) https://ai.meta.com/blog/example
+Article 2: "Nvidia reports record data center revenue on AI demand" (Associated Press) https://apnews.com/article/example
+
+A good answer is:
+TWEET_TEXT: Top tech/AI news:
+1. Meta releases an open-weight Llama model with a 1M token context https://ai.meta.com/blog/example
+2. Nvidia posts record data center revenue on AI demand https://apnews.com/article/example
+#AI #OpenSource #TechNews
+
+Example 3. Given these articles:
+
+Article 1: "Anthropic adds memory to Claude" (Anthropic) https://www.anthropic.com/news/example
+Article 2: "Major cloud outage takes down AI APIs for hours" (Ars Technica) https://arstechnica.com/example
+Article 3: "Kubernetes 1.31 adds native support for AI inference workloads" (CNCF) https://www.cncf.io/blog/example
+
+A good answer is:
+TWEET_TEXT: AI news roundup:
+🧠 Claude can now remember past conversations https://www.anthropic.com/news/example
+🔒 Cloud outage takes AI APIs offline for hours https://arstechnica.com/example
+🚀 Kubernetes 1.31 adds native AI inference support https://www.cncf.io/blog/example
+#AI #DevOps
+
+Example 4. Given these articles:
+
+Article 1: "Microsoft brings Copilot agents to GitHub pull requests" (Microsoft AI) https://blogs.microsoft.com/example
+Article 2: "Researchers show LLM agents can be hijacked through web pages" (MIT Technology Review) https://www.technologyreview.com/example
+Article 3: "Hugging Face releases open dataset of 10 trillion tokens" (Hugging Face) https://huggingface.co/blog/example
+
+A good answer is:
+TWEET_TEXT: Today's top tech/AI news:
+1. Copilot agents start reviewing GitHub pull requests https://blogs.microsoft.com/example
+2. Study: web pages can hijack LLM agents https://www.technologyreview.com/example
+3. Hugging Face opens a 10T-token dataset https://huggingface.co/blog/example
+#AI #LLM"""
+
+# Token counters reported by the Messages API
+USAGE_FIELDS = ("input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+
 class ClaudeProcessor:
     """Class to handle AI processing of news articles using Anthropic's Claude"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, max_candidates: int = 30,
+                 ranker: Optional[RelevanceRanker] = None):
         """
         Initialize the ClaudeProcessor with API credentials
         
         Args:
             api_key (str, optional): Anthropic API key. If not provided, will look for ANTHROPIC_API_KEY env variable.
+            max_candidates (int): Most articles sent to Claude for selection; the rest are trimmed by local ranking
+            ranker (RelevanceRanker, optional): Local pre-ranker used to pick the candidates
         """
         self.api_key = api_key or os.getenv('ANTHROPIC_API_KEY')
         if not self.api_key:
@@ -38,6 +216,14 @@ class ClaudeProcessor:
         # Initialize the Anthropic client
         self.client = anthropic.Anthropic(api_key=self.api_key)
         self.model = "claude-3-opus-20240229"  # Using the most capable model, adjust as needed
+        self.max_candidates = max_candidates
+        self.ranker = ranker or RelevanceRanker()
+        
+        # Token usage across this processor's requests, including prompt cache reads and writes
+        self.usage = {field: 0 for field in USAGE_FIELDS}
+        
+        # Articles chosen by the last process_news call, e.g. to record them as handled
+        self.selected_articles = []
     
     def select_top_news(self, articles: List[Dict[str, Any]], count: int = 3) -> List[Dict[str, Any]]:
         """
@@ -54,6 +240,13 @@ class ClaudeProcessor:
             logger.warning("No articles provided for selection")
             return []
         
+        # Rank locally so only the best candidates are sent to Claude; this also
+        # makes the fallback below pick the best-ranked articles
+        total_articles = len(articles)
+        articles = self.ranker.rank(articles, self.max_candidates)
+        if len(articles) < total_articles:
+            logger.info(f"Pre-ranked {total_articles} articles down to {len(articles)} candidates")
+        
         # Prepare article data for Claude
         article_data = []
         for i, article in enumerate(articles, 1):
@@ -72,16 +265,17 @@ class ClaudeProcessor:
         
         try:
             # Call Claude API
-            logger.info(f"Asking Claude to select top {count} articles from {len(articles)} total articles")
+            logger.info(f"Asking Claude to select top {count} articles from {len(articles)} candidate articles")
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=1000,
                 temperature=0.2,  # Low temperature for more deterministic responses
-                system="You are an expert tech and AI news curator with deep knowledge of the field. Your task is to select the most important and relevant tech/AI news stories.",
+                system=self._cached_system(SELECTION_SYSTEM_PROMPT),
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
             )
+            self._record_usage(response, "selection")
             
             # Extract the selected article IDs from Claude's response
             selected_ids = self._parse_selected_article_ids(response.content[0].text, count)
@@ -99,8 +293,8 @@ class ClaudeProcessor:
             
         except Exception as e:
             logger.error(f"Error calling Claude API for article selection: {str(e)}")
-            # Fallback: return the first 'count' articles if Claude fails
-            logger.info(f"Falling back to selecting first {count} articles")
+            # Fallback: return the 'count' best-ranked articles if Claude fails
+            logger.info(f"Falling back to selecting the top {count} ranked articles")
             return articles[:count]
     
     def format_tweet(self, articles: List[Dict[str, Any]]) -> str:
@@ -140,11 +334,12 @@ class ClaudeProcessor:
                 model=self.model,
                 max_tokens=1000,
                 temperature=0.7,  # Higher temperature for more creative responses
-                system="You are an expert at creating engaging, informative tweets about tech and AI news. Your tweets are concise, accurate, and drive engagement.",
+                system=self._cached_system(TWEET_SYSTEM_PROMPT),
                 messages=[
                     {"role": "user", "content": prompt}
                 ]
             )
+            self._record_usage(response, "tweet")
             
             # Extract the tweet text from Claude's response
             tweet_text = self._parse_tweet_text(response.content[0].text)
@@ -157,6 +352,23 @@ class ClaudeProcessor:
             # Fallback: create a simple tweet if Claude fails
             return self._create_fallback_tweet(articles)
     
+    def _cached_system(self, text: str) -> List[Dict[str, Any]]:
+        """Build a system prompt block marked for Anthropic prompt caching"""
+        return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+    
+    def _record_usage(self, response: Any, step: str) -> None:
+        """Add a response's token usage to the totals and log its prompt cache hits"""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        counts = {field: getattr(usage, field, None) or 0 for field in USAGE_FIELDS}
+        for field, value in counts.items():
+            self.usage[field] += value
+        logger.info(f"Claude {step} usage: {counts['input_tokens']} input tokens, "
+                    f"{counts['cache_read_input_tokens']} read from cache, "
+                    f"{counts['cache_creation_input_tokens']} written to cache, "
+                    f"{counts['output_tokens']} output tokens")
+    
     def _create_selection_prompt(self, article_data: List[Dict[str, Any]], count: int) -> str:
         """Create a prompt for Claude to select the top articles"""
         articles_text = "\n\n".join([
@@ -169,23 +381,11 @@ class ClaudeProcessor:
             for article in article_data
         ])
         
-        prompt = f"""I have a list of {len(article_data)} tech and AI news articles. Please select the {count} most important and relevant articles based on:
-
-1. Significance to the tech/AI industry
-2. Novelty and innovation factor
-3. Potential impact on the field
-4. Credibility of the source
-5. Recency and timeliness
+        prompt = f"""Select the {count} most important and relevant of these {len(article_data)} tech and AI news articles.
 
 Here are the articles:
 
-{articles_text}
-
-Please respond with ONLY the article IDs of your top {count} selections in this exact format:
-SELECTED_ARTICLES: [id1, id2, id3]
-
-For example:
-SELECTED_ARTICLES: [4, 12, 7]"""
+{articles_text}"""
         
         return prompt
     
@@ -224,20 +424,11 @@ SELECTED_ARTICLES: [4, 12, 7]"""
             for article in article_data
         ])
         
-        prompt = f"""I have selected {len(article_data)} important tech/AI news articles. Please create an engaging tweet that:
-
-1. Briefly mentions all {len(article_data)} stories
-2. Includes the URLs for each article
-3. Uses appropriate hashtags (#AI, #TechNews, etc.)
-4. Stays within Twitter's 280 character limit
-5. Is engaging and informative
+        prompt = f"""Create a tweet for these {len(article_data)} tech/AI news articles.
 
 Here are the articles:
 
-{articles_text}
-
-Please respond with ONLY the tweet text in this exact format:
-TWEET_TEXT: [Your formatted tweet here]"""
+{articles_text}"""
         
         return prompt
     
@@ -307,6 +498,7 @@ TWEET_TEXT: [Your formatted tweet here]"""
             
             # Select top articles
             selected_articles = self.select_top_news(articles)
+            self.selected_articles = selected_articles
             
             # Format tweet
             tweet_text = self.format_tweet(selected_articles)
@@ -316,6 +508,7 @@ TWEET_TEXT: [Your formatted tweet here]"""
                 f.write(tweet_text)
             
             logger.info(f"Saved tweet to {output_file}")
+            logger.info(f"Claude token usage this run: {self.usage}")
             
             return tweet_text
             
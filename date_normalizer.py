@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Date Normalizer for AI News Automation
+
+This module turns the raw date strings scraped from blogs and feeds (RFC 822
+feed dates, ISO 8601 timestamps, "October 15, 2026", "3 days ago", ...) into
+UTC datetimes, so stale articles can be dropped before they are sent to
+Claude. The format that worked last is remembered per source and tried
+first, and parsed strings are memoized.
+"""
+
+import logging
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('date_normalizer')
+
+# Human-readable formats seen on blog index pages
+STRPTIME_FORMATS = [
+    "%B %d, %Y",
+    "%b %d, %Y",
+    "%b. %d, %Y",
+    "%d %B %Y",
+    "%d %b %Y",
+    "%B %d %Y",
+    "%b %d %Y",
+    "%A, %B %d, %Y",
+    "%Y/%m/%d",
+    "%m/%d/%Y",
+    "%Y-%m-%d %H:%M:%S"
+]
+
+# Formats without a year, e.g. "Oct 15" on listings that only show the current year
+YEARLESS_FORMATS = ["%b %d", "%B %d"]
+
+_RELATIVE_RE = re.compile(r'^(an?|\d+)\s+(minute|hour|day|week|month|year)s?\s+ago$', re.IGNORECASE)
+_RELATIVE_UNITS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365)
+}
+_ORDINAL_RE = re.compile(r'(\d{1,2})(st|nd|rd|th)\b')
+
+def _as_utc(value):
+    """Convert a datetime to UTC, treating naive values as UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def _parse_iso(text):
+    """Parse an ISO 8601 date or timestamp"""
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    return datetime.fromisoformat(text)
+
+def _parse_rfc822(text):
+    """Parse an RFC 822 / RFC 2822 feed date"""
+    return parsedate_to_datetime(text)
+
+def _make_strptime_parser(date_format):
+    """Build a parser for a single strptime format"""
+    def parse(text):
+        return datetime.strptime(text, date_format)
+    return parse
+
+def _make_yearless_parser(date_format):
+    """Build a parser for a format without a year, assuming the most recent such date"""
+    def parse(text):
+        now = datetime.now(timezone.utc)
+        parsed = datetime.strptime(f"{text} {now.year}", f"{date_format} %Y").replace(tzinfo=timezone.utc)
+        if parsed > now + timedelta(days=1):
+            parsed = parsed.replace(year=now.year - 1)
+        return parsed
+    return parse
+
+# Parsers in the order they are tried; the key is what gets remembered per source
+PARSERS = (
+    [("iso", _parse_iso), ("rfc822", _parse_rfc822)]
+    + [(date_format, _make_strptime_parser(date_format)) for date_format in STRPTIME_FORMATS]
+)
+_PARSERS_BY_KEY = dict(PARSERS)
+_YEARLESS_PARSERS = [(date_format, _make_yearless_parser(date_format)) for date_format in YEARLESS_FORMATS]
+
+@lru_cache(maxsize=4096)
+def _parse_with(key, text):
+    """
+    Parse a date string with one parser, memoized
+
+    Returns:
+        datetime: UTC datetime, or None if the parser doesn't accept the string
+    """
+    try:
+        return _as_utc(_PARSERS_BY_KEY[key](text))
+    except (ValueError, TypeError, IndexError, OverflowError):
+        return None
+
+def _parse_relative(text):
+    """Parse "today", "yesterday" and "N units ago" relative to now"""
+    lowered = text.lower()
+    now = datetime.now(timezone.utc)
+    if lowered in ("today", "just now"):
+        return now
+    if lowered == "yesterday":
+        return now - timedelta(days=1)
+
+    match = _RELATIVE_RE.match(lowered)
+    if match:
+        amount = 1 if match.group(1) in ("a", "an") else int(match.group(1))
+        return now - amount * _RELATIVE_UNITS[match.group(2)]
+    return None
+
+class DateNormalizer:
+    """Class to parse scraped date strings into UTC datetimes"""
+
+    def __init__(self):
+        """Initialize the per-source format memory"""
+        self._source_formats = {}
+        self._lock = threading.Lock()
+
+    def normalize(self, date_str, source=None):
+        """
+        Parse a raw date string into a UTC datetime
+
+        Args:
+            date_str (str): Date as it appeared on the page or in the feed
+            source (str, optional): Name of the source, used to remember which format it uses
+
+        Returns:
+            datetime: Timezone-aware UTC datetime, or None if the string couldn't be parsed
+        """
+        if not date_str:
+            return None
+        text = " ".join(date_str.split())
+        text = _ORDINAL_RE.sub(r"\1", text)
+
+        with self._lock:
+            preferred = self._source_formats.get(source)
+
+        # Try the format this source used last time before everything else
+        keys = [key for key, _ in PARSERS]
+        if preferred in _PARSERS_BY_KEY:
+            keys.remove(preferred)
+            keys.insert(0, preferred)
+
+        for key in keys:
+            parsed = _parse_with(key, text)
+            if parsed is not None:
+                if source is not None and key != preferred:
+                    with self._lock:
+                        self._source_formats[source] = key
+                return parsed
+
+        # Relative and year-less dates depend on the current time, so they aren't memoized
+        parsed = _parse_relative(text)
+        if parsed is not None:
+            return parsed
+        for _, parser in _YEARLESS_PARSERS:
+            try:
+                return parser(text)
+            except ValueError:
+                continue
+
+        logger.debug(f"Could not parse date '{date_str}' from {source or 'unknown source'}")
+        return None
+
+def to_iso(value):
+    """
+    Format a UTC datetime the way NewsAPI formats publishedAt
+
+    Args:
+        value (datetime): Timezone-aware datetime
+
+    Returns:
+        str: Timestamp like 2026-10-18T09:30:00Z
+    """
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def filter_recent(articles, days, normalizer=None):
+    """
+    Normalize publishedAt on each article and drop articles older than the window
+
+    Articles whose date can't be parsed are kept, since their age is unknown.
+    The cutoff is the start of the day `days` days ago, so date-only values
+    from that day are still included.
+
+    Args:
+        articles (list): Article dictionaries with publishedAt and source.name
+        days (int): Keep articles published within this many days
+        normalizer (DateNormalizer, optional): Normalizer to use, defaults to a new one
+
+    Returns:
+        list: The recent articles, with publishedAt rewritten in place as ISO 8601 UTC where it
+            could be parsed; updating the same dicts keeps objects that hold them, like the
+            scraper's HTTP cache entries, in step with later in-place enrichment
+    """
+    normalizer = normalizer or DateNormalizer()
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    recent_articles = []
+    unparsed = 0
+    for article in articles:
+        source = (article.get("source") or {}).get("name")
+        published = normalizer.normalize(article.get("publishedAt"), source)
+
+        if published is None:
+            unparsed += 1
+            recent_articles.append(article)
+        elif published >= cutoff:
+            article["publishedAt"] = to_iso(published)
+            recent_articles.append(article)
+
+    dropped = len(articles) - len(recent_articles)
+    if dropped or unparsed:
+        logger.info(f"Dropped {dropped} articles older than {days} days ({unparsed} with unparseable dates kept)")
+    return recent_articles
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        normalizer = DateNormalizer()
+        samples = [
+            "Mon, 12 Oct 2026 10:00:00 GMT",
+            "2026-10-15T08:30:00.000-07:00",
+            "October 15th, 2026",
+            "Oct 15, 2026",
+            "3 days ago",
+            "not a date"
+        ]
+        for sample in samples:
+            print(f"{sample!r:40} -> {normalizer.normalize(sample, 'Example')}")
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
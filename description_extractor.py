@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Streaming Description Extractor for AI News Automation
+
+This module pulls an article's description out of a page while it is still
+downloading. It reads the response incrementally, returns the
+<meta name="description"> content as soon as it is seen in <head>, or
+otherwise the first paragraph inside an article/post/content container,
+and then stops so the rest of a heavy page is never downloaded or parsed.
+"""
+
+import codecs
+import logging
+import re
+from html.parser import HTMLParser
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('description_extractor')
+
+# Elements that never have a closing tag, so they are not tracked on the stack
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr"
+}
+
+# Matches the scraper's "article p, .article p, .post p, .content p" selector
+CONTAINER_TAGS = {"article"}
+CONTAINER_CLASSES = {"article", "post", "content"}
+
+_CHARSET_RE = re.compile(r'charset=["\']?([\w-]+)', re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+class DescriptionExtractor(HTMLParser):
+    """Incremental HTML parser that stops at the first usable description"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.meta_description = None
+        self.paragraph = None
+        self._stack = []
+        self._containers_open = 0
+        self._paragraph_parts = None
+
+    @property
+    def done(self):
+        """True once a description has been found"""
+        return bool(self.meta_description or self.paragraph)
+
+    @property
+    def description(self):
+        """The meta description if present, otherwise the first container paragraph"""
+        return self.meta_description or self.paragraph
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        attributes = dict(attrs)
+
+        if tag == "meta":
+            if (attributes.get("name") or "").lower() == "description" and attributes.get("content"):
+                self.meta_description = attributes["content"].strip()
+            return
+        if tag in VOID_ELEMENTS:
+            return
+
+        # An unclosed <p> ends where the next one starts
+        if tag == "p":
+            self._finish_paragraph()
+
+        # Only paragraphs nested inside a container count, not the container itself
+        if tag == "p" and self._containers_open:
+            self._paragraph_parts = []
+
+        classes = set((attributes.get("class") or "").split())
+        is_container = tag in CONTAINER_TAGS or bool(classes & CONTAINER_CLASSES)
+        self._stack.append((tag, is_container))
+        if is_container:
+            self._containers_open += 1
+
+    def handle_endtag(self, tag):
+        if self.done or tag in VOID_ELEMENTS:
+            return
+
+        if tag == "p":
+            self._finish_paragraph()
+
+        # Pop up to the matching open tag, tolerating unclosed children
+        if any(open_tag == tag for open_tag, _ in self._stack):
+            while self._stack:
+                open_tag, is_container = self._stack.pop()
+                if is_container:
+                    self._containers_open -= 1
+                if open_tag == tag:
+                    break
+
+    def handle_data(self, data):
+        if self._paragraph_parts is not None:
+            self._paragraph_parts.append(data)
+
+    def _finish_paragraph(self):
+        """Close the paragraph being captured, keeping it if it has text"""
+        if self._paragraph_parts is None:
+            return
+        text = _WHITESPACE_RE.sub(" ", "".join(self._paragraph_parts)).strip()
+        self._paragraph_parts = None
+        if text:
+            self.paragraph = text
+
+def _response_encoding(response):
+    """Get the charset declared in the Content-Type header, defaulting to UTF-8"""
+    match = _CHARSET_RE.search(response.headers.get("Content-Type", ""))
+    if match:
+        try:
+            codecs.lookup(match.group(1))
+            return match.group(1)
+        except LookupError:
+            pass
+    return "utf-8"
+
+def extract_description(response, max_bytes=512 * 1024, chunk_size=8192):
+    """
+    Read a streamed response until a description is found
+
+    The response is closed before returning, which drops the connection
+    instead of draining the rest of the page.
+
+    Args:
+        response: requests.Response opened with stream=True
+        max_bytes (int): Stop reading after this many bytes
+        chunk_size (int): Bytes read per step
+
+    Returns:
+        str: The meta description or first article paragraph, or None if neither was found
+    """
+    parser = DescriptionExtractor()
+    decoder = codecs.getincrementaldecoder(_response_encoding(response))(errors="replace")
+    total_bytes = 0
+
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            total_bytes += len(chunk)
+            parser.feed(decoder.decode(chunk))
+            if parser.done:
+                break
+            if total_bytes >= max_bytes:
+                logger.info(f"No description in the first {max_bytes} bytes of {response.url}")
+                break
+    finally:
+        response.close()
+
+    logger.debug(f"Read {total_bytes} bytes of {response.url} to find its description")
+    return parser.description
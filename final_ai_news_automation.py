@@ -28,47 +28,72 @@ logging.basicConfig(
 )
 logger = logging.getLogger('final_ai_news_automation')
 
-def run_final_automation():
-    """Run the complete AI news automation process with all enhancements"""
+def run_final_automation(concurrent_scraping=False, overlap_sources=True):
+    """
+    Run the complete AI news automation process with all enhancements
+    
+    Args:
+        concurrent_scraping (bool): Opt in to scraping the AI company blogs in parallel (improved scraper only)
+        overlap_sources (bool): Run NewsAPI queries and blog scraping together on the async fetch loop
+    """
     start_time = time.time()
     logger.info("Starting Final Enhanced AI News Automation process")
     
     try:
-        # Step 1a: Fetch news from NewsAPI
-        logger.info("Step 1a: Fetching news articles from NewsAPI")
+        # Articles handled by previous runs are skipped, so each run only processes what's new
+        from seen_index import SeenArticleIndex
+        seen_index = SeenArticleIndex()
+        
         from news_fetcher import NewsFetcher
-        fetcher = NewsFetcher()
-        articles = fetcher.fetch_tech_ai_news(days=1, max_articles=10)
-        fetcher.save_articles_to_file(articles, "newsapi_articles.json")
-        logger.info(f"Fetched {len(articles)} articles from NewsAPI")
+        fetcher = NewsFetcher(seen_index=seen_index)
         
-        # Step 1b: Scrape news from AI company blogs with improved scraper
-        logger.info("Step 1b: Scraping news from AI company blogs with improved scraper")
         try:
             # Try to import the improved scraper first
             from ai_blog_scraper_improved import AIBlogScraperImproved
-            scraper = AIBlogScraperImproved()
+            scraper = AIBlogScraperImproved(seen_index=seen_index)
+            improved_scraper = True
             logger.info("Using improved blog scraper with RSS support")
         except ImportError:
             # Fall back to original scraper if improved version not available
             from ai_blog_scraper import AIBlogScraper
             scraper = AIBlogScraper()
+            improved_scraper = False
             logger.info("Using original blog scraper")
         
-        scraped_articles = scraper.scrape_all_blogs(days_back=3, max_articles_per_blog=2)
+        if overlap_sources and improved_scraper:
+            # Step 1: Run NewsAPI queries and blog scraping on the shared fetch loop
+            logger.info("Step 1: Fetching NewsAPI articles and scraping AI company blogs concurrently")
+            from async_fetcher import get_async_fetcher
+            articles, scraped_articles = get_async_fetcher().run_all(
+                fetcher.fetch_tech_ai_news_async(days=1, max_articles=10),
+                scraper.scrape_all_blogs_async(days_back=3, max_articles_per_blog=2)
+            )
+            fetcher.save_articles_to_file(articles, "newsapi_articles.json")
+            logger.info(f"Fetched {len(articles)} articles from NewsAPI")
+        else:
+            # Step 1a: Fetch news from NewsAPI
+            logger.info("Step 1a: Fetching news articles from NewsAPI")
+            articles = fetcher.fetch_tech_ai_news(days=1, max_articles=10)
+            fetcher.save_articles_to_file(articles, "newsapi_articles.json")
+            logger.info(f"Fetched {len(articles)} articles from NewsAPI")
+            
+            # Step 1b: Scrape news from AI company blogs
+            logger.info("Step 1b: Scraping news from AI company blogs")
+            scrape_options = {"concurrent": concurrent_scraping} if improved_scraper else {}
+            scraped_articles = scraper.scrape_all_blogs(days_back=3, max_articles_per_blog=2, **scrape_options)
         logger.info(f"Scraped {len(scraped_articles)} articles from AI company blogs")
         
-        # Combine the results
-        combined_articles = articles + scraped_articles
+        # Combine the results, dropping anything a previous run handled (the
+        # original scraper doesn't check the index itself)
+        combined_articles = seen_index.filter_new(articles + scraped_articles)
         
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_articles = []
-        for article in combined_articles:
-            url = article.get("url")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_articles.append(article)
+        # Remove duplicates (same URL or same story), following short links
+        # so they match the articles they point to
+        from story_dedup import dedupe_articles
+        from url_canonicalizer import RedirectResolver
+        redirect_resolver = RedirectResolver()
+        unique_articles = dedupe_articles(combined_articles, resolver=redirect_resolver)
+        redirect_resolver.save()
         
         # Save the combined results
         with open("latest_ai_news.json", 'w', encoding='utf-8') as f:
@@ -107,6 +132,15 @@ def run_final_automation():
             tweet_id = result.get('data', {}).get('id')
             logger.info(f"Posted tweet successfully using original implementation. Tweet ID: {tweet_id}")
         
+        # Remember the posted stories, including the other outlets' copies that
+        # were collapsed into them; candidates that weren't selected stay
+        # eligible for the next run
+        posted_articles = processor.selected_articles
+        seen_index.mark(posted_articles + [
+            {"url": url} for article in posted_articles for url in article.get("related_urls", [])
+        ])
+        seen_index.save()
+        
         # Record successful run
         with open("last_successful_run.txt", "w") as f:
             f.write(f"Last successful run: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+HTTP Conditional-GET Cache for AI News Automation
+
+This module remembers the ETag and Last-Modified validators of blog pages
+and RSS feeds together with the articles extracted from them. The scraper
+sends If-None-Match / If-Modified-Since on the next fetch, and when the
+server answers 304 Not Modified it reuses the stored articles instead of
+downloading and parsing the page again.
+"""
+
+import logging
+import threading
+import time
+
+from json_state import load_json_state, save_json_state
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('http_cache')
+
+class ConditionalCache:
+    """Class to store HTTP validators and extracted articles per URL"""
+
+    def __init__(self, cache_file="http_cache.json", max_entries=1000):
+        """
+        Initialize the cache and load any existing entries from disk
+
+        Args:
+            cache_file (str): Path of the JSON cache file
+            max_entries (int): Maximum number of URLs kept; least recently stored are evicted first
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self):
+        """Load entries from the cache file, starting empty if it is missing or corrupt"""
+        entries = load_json_state(self.cache_file, "HTTP cache")
+        if entries:
+            logger.info(f"Loaded {len(entries)} cached HTTP validators from {self.cache_file}")
+        return entries
+
+    def conditional_headers(self, url, max_articles):
+        """
+        Build the conditional request headers for a URL
+
+        No headers are returned when the stored articles were extracted with a
+        lower article limit, since a 304 could not satisfy the request.
+
+        Args:
+            url (str): URL about to be fetched
+            max_articles (int): Number of articles the caller wants
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers, possibly empty
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if not entry or entry.get("max_articles", 0) < max_articles:
+                return {}
+
+            headers = {}
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+            return headers
+
+    def get_articles(self, url, max_articles):
+        """
+        Get the articles stored for a URL after a 304 response
+
+        Args:
+            url (str): URL that was not modified
+            max_articles (int): Maximum number of articles to return
+
+        Returns:
+            list: Stored article dictionaries, or None if nothing is cached
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            logger.info(f"{url} not modified, reusing {len(entry['articles'])} cached articles")
+            return [dict(article) for article in entry["articles"][:max_articles]]
+
+    def store(self, url, articles, max_articles, etag=None, last_modified=None):
+        """
+        Remember a URL's validators and the articles extracted from it
+
+        Nothing is stored without an ETag or Last-Modified value, since the
+        URL couldn't be revalidated.
+
+        Args:
+            url (str): URL that was fetched
+            articles (list): Articles extracted from the response
+            max_articles (int): Article limit used during extraction
+            etag (str, optional): ETag response header
+            last_modified (str, optional): Last-Modified response header
+        """
+        if not etag and not last_modified:
+            return
+
+        with self._lock:
+            self._entries[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "max_articles": max_articles,
+                "articles": articles,
+                "stored_at": time.time()
+            }
+
+    def store_response(self, url, response, articles, max_articles):
+        """
+        Remember the validators of a requests.Response and the articles extracted from it
+
+        Args:
+            url (str): URL that was fetched
+            response: requests.Response for the URL
+            articles (list): Articles extracted from the response
+            max_articles (int): Article limit used during extraction
+        """
+        self.store(
+            url,
+            articles,
+            max_articles,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified")
+        )
+
+    def save(self):
+        """
+        Enforce the size limit and write the cache to disk
+
+        Returns:
+            bool: True if the cache was written
+        """
+        with self._lock:
+            if len(self._entries) > self.max_entries:
+                newest = sorted(self._entries.items(), key=lambda item: item[1]["stored_at"], reverse=True)
+                self._entries = dict(newest[:self.max_entries])
+
+            return save_json_state(self.cache_file, self._entries, "HTTP cache")
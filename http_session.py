@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP Session Manager for AI News Automation
+
+This module provides a shared requests session with keep-alive connection
+pools, per-host pool sizing and retry adapters. The news fetcher, blog
+scraper, tweet formatter and Twitter poster all use it, so repeated requests
+to the same host within a run reuse connections instead of paying a new
+TCP/TLS handshake every time.
+"""
+
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('http_session')
+
+class SessionManager:
+    """Class to build and hold a pooled, retrying requests session"""
+
+    def __init__(
+        self,
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        host_pool_sizes=None,
+        self_limited_hosts=("newsapi.org",)
+    ):
+        """
+        Initialize the session manager
+
+        Args:
+            pool_connections (int): Number of per-host connection pools to keep
+            pool_maxsize (int): Maximum number of kept-alive connections per host
+            max_retries (int): Retries for connection errors and retryable statuses
+            backoff_factor (float): Exponential backoff factor between retries
+            status_forcelist (tuple): HTTP statuses that trigger a retry; 429 is left out by default
+                since the callers' rate limiters pause the whole host instead
+            host_pool_sizes (dict, optional): Per-host overrides of pool_maxsize, keyed by hostname
+            self_limited_hosts (tuple): Hosts whose 429 responses are never retried, even if
+                status_forcelist includes 429
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = tuple(status_forcelist)
+        self.host_pool_sizes = dict(host_pool_sizes or {})
+        self.self_limited_hosts = frozenset(self_limited_hosts)
+
+        self._session = None
+        self._lock = threading.Lock()
+
+    def _build_retry(self, self_limited=False):
+        """Build the retry policy for an adapter"""
+        # A self-limited host's 429 always goes straight back to the caller, which
+        # pauses its own requests
+        status_forcelist = self.status_forcelist
+        if self_limited:
+            status_forcelist = tuple(status for status in status_forcelist if status != 429)
+
+        # Only idempotent methods are retried, so tweets are never posted twice
+        return Retry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=status_forcelist,
+            allowed_methods=frozenset(["HEAD", "GET", "OPTIONS"]),
+            # Retry-After is honoured by the callers (HostRateLimiter.observe and
+            # NewsFetcher's backoff), which pause the host for every request;
+            # sleeping here would block one request outside its timeouts
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+
+    def _build_adapter(self, pool_maxsize, self_limited=False):
+        """Build a connection-pooling adapter with the retry policy"""
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=self._build_retry(self_limited)
+        )
+
+    def _mount_host(self, session, host):
+        """Mount the adapter for a host with its own pool size or retry policy"""
+        host_adapter = self._build_adapter(
+            self.host_pool_sizes.get(host, self.pool_maxsize),
+            self_limited=host in self.self_limited_hosts
+        )
+        session.mount(f"https://{host}", host_adapter)
+        session.mount(f"http://{host}", host_adapter)
+
+    def get_session(self):
+        """
+        Get the pooled session, creating it on first use
+
+        Returns:
+            requests.Session: Session with pooling and retry adapters mounted
+        """
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                default_adapter = self._build_adapter(self.pool_maxsize)
+                session.mount("https://", default_adapter)
+                session.mount("http://", default_adapter)
+
+                # More specific prefixes win, so these override the defaults per host
+                for host in set(self.host_pool_sizes) | self.self_limited_hosts:
+                    self._mount_host(session, host)
+
+                self._session = session
+                logger.info(
+                    f"Created pooled HTTP session (pool size {self.pool_maxsize}, "
+                    f"{len(self.host_pool_sizes)} host overrides, {self.max_retries} retries)"
+                )
+            return self._session
+
+    def set_host_pool_size(self, host, pool_maxsize):
+        """
+        Set the connection pool size for a single host
+
+        Args:
+            host (str): Hostname, e.g. "newsapi.org"
+            pool_maxsize (int): Maximum number of kept-alive connections to the host
+        """
+        with self._lock:
+            self.host_pool_sizes[host] = pool_maxsize
+            if self._session is not None:
+                self._mount_host(self._session, host)
+
+    def close(self):
+        """Close the session and all pooled connections"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_default_manager = SessionManager()
+
+def configure_sessions(**options):
+    """
+    Replace the shared session manager with one using the given options
+
+    Call this before the first request of a run; components that already
+    hold the old session keep using it.
+
+    Args:
+        **options: Keyword arguments for SessionManager
+
+    Returns:
+        SessionManager: The new shared manager
+    """
+    global _default_manager
+    _default_manager.close()
+    _default_manager = SessionManager(**options)
+    return _default_manager
+
+def get_session():
+    """
+    Get the shared pooled session
+
+    Returns:
+        requests.Session: Shared session
+    """
+    return _default_manager.get_session()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+JSON State Files for AI News Automation
+
+This module loads and saves the small JSON files the components keep
+between runs, such as caches and indexes of earlier results. A missing or
+corrupt file starts the component empty instead of failing the run, and
+saves go through a temporary file that replaces the old one atomically, so
+a crash can't leave a half-written file behind.
+"""
+
+import json
+import logging
+import os
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('json_state')
+
+def load_json_state(path, description, default=dict):
+    """
+    Load a JSON state file
+
+    Args:
+        path (str): Path of the file
+        description (str): What the file holds, for log messages (e.g. "link cache")
+        default (callable): Builds the empty state used when the file is missing or unreadable
+
+    Returns:
+        The parsed JSON, or default() if the file is missing or corrupt
+    """
+    if not os.path.exists(path):
+        return default()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Could not read {description} {path}, starting empty: {str(e)}")
+        return default()
+
+def save_json_state(path, data, description):
+    """
+    Write a JSON state file atomically
+
+    Args:
+        path (str): Path of the file
+        data: JSON-serializable state
+        description (str): What the file holds, for log messages
+
+    Returns:
+        bool: True if the file was written
+    """
+    try:
+        temp_file = f"{path}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_file, path)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save {description}: {str(e)}")
+        return False
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        save_json_state("example_state.json", {"runs": 1}, "example state")
+        print(load_json_state("example_state.json", "example state"))
+        os.remove("example_state.json")
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
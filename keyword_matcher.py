@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Multi-Keyword Matcher for AI News Automation
+
+This module finds which of a (possibly large) set of keywords occur in an
+article with a single compiled, case-insensitive regular expression instead
+of one substring search per keyword and field. Keywords only match as whole
+words or phrases ("ai" doesn't match "said"), longer keywords win over
+their prefixes, a trailing plural "s" is accepted, keywords ending in a
+digit also match model-name variants ("gpt-4" matches "GPT-4o"), and
+missing (None) fields are skipped. Matchers are built once per keyword set and reused.
+"""
+
+import logging
+import re
+from functools import lru_cache
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('keyword_matcher')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def _normalize(keyword):
+    """Lowercase a keyword and collapse its whitespace"""
+    return _WHITESPACE_RE.sub(" ", keyword.strip()).lower()
+
+def _suffix_for(keyword):
+    """Pattern for what may follow a keyword: a version suffix after a digit, else a plural s"""
+    return r'[a-z0-9]*' if keyword[-1].isdigit() else r's?'
+
+class KeywordMatcher:
+    """Class to find keyword hits in text with one compiled pattern"""
+
+    def __init__(self, keywords):
+        """
+        Compile the pattern for a keyword set
+
+        Args:
+            keywords (iterable): Keywords or phrases to look for
+        """
+        self.keywords = tuple(dict.fromkeys(_normalize(keyword) for keyword in keywords if keyword.strip()))
+
+        # Longest first so "microsoft ai" is preferred over "microsoft"; each
+        # alternative is a named group so a hit maps straight back to its keyword
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        alternatives = [
+            f'(?P<k{index}>' + r'\s+'.join(re.escape(part) for part in keyword.split(" ")) + _suffix_for(keyword) + ')'
+            for index, keyword in enumerate(ordered)
+        ]
+        self._pattern = re.compile(
+            r'(?<!\w)(?:' + '|'.join(alternatives) + r')(?!\w)',
+            re.IGNORECASE
+        ) if alternatives else None
+        self._keyword_by_group = {f'k{index}': keyword for index, keyword in enumerate(ordered)}
+
+    def find(self, *texts):
+        """
+        Find the keywords that occur in any of the texts
+
+        Args:
+            *texts: Strings to search; None and empty values are skipped
+
+        Returns:
+            list: Matched keywords in order of first occurrence, without duplicates
+        """
+        if self._pattern is None:
+            return []
+        matched = {}
+        for text in texts:
+            if not text:
+                continue
+            for match in self._pattern.finditer(text):
+                matched.setdefault(self._keyword_by_group[match.lastgroup], None)
+        return list(matched)
+
+    def match_article(self, article, fields=("title", "description", "content")):
+        """
+        Find the keywords that occur in an article's text fields
+
+        Args:
+            article (dict): Article dictionary
+            fields (tuple): Fields to search
+
+        Returns:
+            list: Matched keywords
+        """
+        return self.find(*(article.get(field) for field in fields))
+
+@lru_cache(maxsize=32)
+def get_keyword_matcher(keywords):
+    """
+    Get the matcher for a keyword set, compiling it on first use
+
+    Args:
+        keywords (tuple): Keywords; must be a tuple so it can be cached
+
+    Returns:
+        KeywordMatcher: Compiled matcher
+    """
+    logger.debug(f"Compiling keyword matcher for {len(keywords)} keywords")
+    return KeywordMatcher(keywords)
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        matcher = get_keyword_matcher(("openai", "gpt-4", "large language model", "llm", "ai"))
+        article = {
+            "title": "OpenAI ships GPT-4o update",
+            "description": "New large  language models and LLMs, the company said",
+            "content": None
+        }
+        print(matcher.match_article(article))
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
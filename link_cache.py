@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Link Validation Cache for AI News Automation
+
+This module keeps an on-disk record of link validation results (status code,
+final redirect URL and check time) so the tweet formatter can skip HEAD
+requests for links it checked recently. Broken links are cached for a
+shorter time than working ones, and the cache is bounded in size. Entries
+are keyed by canonical URL, so tracking-parameter and scheme variants of a
+link share one result.
+"""
+
+import logging
+import threading
+import time
+
+from json_state import load_json_state, save_json_state
+from url_canonicalizer import canonicalize_url
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('link_cache')
+
+class LinkValidationCache:
+    """Class to persist link validation results with TTL and size-based eviction"""
+
+    def __init__(self, cache_file="link_validation_cache.json", ttl=24 * 3600, negative_ttl=3600, max_entries=5000):
+        """
+        Initialize the cache and load any existing entries from disk
+
+        Args:
+            cache_file (str): Path of the JSON cache file
+            ttl (int): Seconds a working link stays fresh
+            negative_ttl (int): Seconds a broken or unreachable link stays fresh
+            max_entries (int): Maximum number of entries kept; oldest checks are evicted first
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self):
+        """Load entries from the cache file, starting empty if it is missing or corrupt"""
+        entries = load_json_state(self.cache_file, "link cache")
+        if entries:
+            logger.info(f"Loaded {len(entries)} cached link checks from {self.cache_file}")
+        return entries
+
+    def _is_fresh(self, entry, now):
+        """Check whether an entry is still within its TTL"""
+        ttl = self.ttl if entry.get("valid") else self.negative_ttl
+        return now - entry.get("checked_at", 0) < ttl
+
+    def get(self, url):
+        """
+        Get the cached result for a URL if it is still fresh
+
+        Args:
+            url (str): URL that was validated
+
+        Returns:
+            dict: Entry with valid, status, final_url and checked_at, or None if missing or stale
+        """
+        with self._lock:
+            entry = self._entries.get(canonicalize_url(url))
+            if entry and self._is_fresh(entry, time.time()):
+                return entry
+            return None
+
+    def set(self, url, valid, status=None, final_url=None):
+        """
+        Record a validation result
+
+        Args:
+            url (str): URL that was validated
+            valid (bool): Whether the link is usable
+            status (int, optional): HTTP status code, None if the request failed
+            final_url (str, optional): URL after following redirects
+        """
+        with self._lock:
+            self._entries[canonicalize_url(url)] = {
+                "valid": valid,
+                "status": status,
+                "final_url": final_url or url,
+                "checked_at": time.time()
+            }
+
+    def save(self):
+        """
+        Drop stale entries, enforce the size limit and write the cache to disk
+
+        Returns:
+            bool: True if the cache was written
+        """
+        with self._lock:
+            now = time.time()
+            fresh = {url: entry for url, entry in self._entries.items() if self._is_fresh(entry, now)}
+
+            if len(fresh) > self.max_entries:
+                newest = sorted(fresh.items(), key=lambda item: item[1]["checked_at"], reverse=True)
+                fresh = dict(newest[:self.max_entries])
+
+            self._entries = fresh
+            return save_json_state(self.cache_file, fresh, "link cache")
@@ -8,11 +8,25 @@ to ensure relevant content is retrieved.
 """
 
 import os
+import asyncio
 import requests
 import json
-from datetime import datetime, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 import logging
 
+from async_fetcher import get_async_fetcher
+from http_session import get_session
+from keyword_matcher import get_keyword_matcher
+from newsapi_cache import NewsAPICache
+from newsapi_watermarks import ISO_FORMAT, HighWaterMarks
+from query_planner import QuotaTracker, plan_queries
+from rate_limiter import parse_retry_after
+from source_registry import get_source_registry
+from story_dedup import dedupe_articles
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -20,47 +34,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger('news_fetcher')
 
+class NewsAPIRateLimited(requests.exceptions.RequestException):
+    """Raised instead of sending a request while NewsAPI has asked us to back off for too long"""
+
 class NewsFetcher:
     """Class to handle fetching news from NewsAPI"""
     
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, session=None, seen_index=None, registry=None, response_cache=None,
+                 watermarks=None):
         """
         Initialize the NewsFetcher with API credentials
         
         Args:
             api_key (str, optional): NewsAPI key. If not provided, will look for NEWSAPI_KEY env variable.
+            session (requests.Session, optional): HTTP session to use, defaults to the shared pooled session
+            seen_index (SeenArticleIndex, optional): Articles handled by previous runs, which are left out
+            registry (SourceRegistry, optional): Configured sources; the "NewsAPI" entry's queries
+                replace the built-in ones, defaults to the registry for sources.json
+            response_cache (NewsAPICache, optional): Cache of earlier responses, defaults to the on-disk cache
+            watermarks (HighWaterMarks, optional): Newest publishedAt per query for incremental fetches,
+                defaults to the on-disk state
         """
         self.api_key = api_key or os.getenv('NEWSAPI_KEY')
         if not self.api_key:
             raise ValueError("NewsAPI key is required. Set NEWSAPI_KEY environment variable or pass as parameter.")
         
+        self.session = session or get_session()
+        self.seen_index = seen_index
+        self.response_cache = response_cache or NewsAPICache()
+        self.watermarks = watermarks or HighWaterMarks()
         self.base_url = "https://newsapi.org/v2"
         self.headers = {
             "X-Api-Key": self.api_key,
             "User-Agent": "AINewsAutomation/1.0"
         }
-    
-    def fetch_tech_ai_news(self, days=1, max_articles=20):
-        """
-        Fetch recent tech and AI news articles
-        
-        Args:
-            days (int): How many days back to search for news
-            max_articles (int): Maximum number of articles to retrieve
-            
-        Returns:
-            list: List of news article dictionaries
-        """
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
-        
-        # Format dates for API
-        from_date = start_date.strftime('%Y-%m-%d')
-        to_date = end_date.strftime('%Y-%m-%d')
         
-        # Define search queries for tech and AI news
-        queries = [
+        # Define search queries for tech and AI news, unless the sources file configures them
+        self.queries = [
             "artificial intelligence",
             "machine learning",
             "AI technology",
@@ -76,51 +86,421 @@ class NewsFetcher:
             "DevOps AI"
         ]
         
-        all_articles = []
+        # Keywords an article must mention to count as relevant, unless the sources file configures them
+        self.relevant_keywords = [
+            "chatgpt", "gpt-4", "gpt-5", "claude", "anthropic",
+            "openai", "microsoft ai", "copilot", "kubernetes",
+            "devops", "llm", "large language model"
+        ]
         
-        # Make requests for each query
-        for query in queries:
-            try:
-                logger.info(f"Fetching news for query: {query}")
-                
-                # Construct the API endpoint for everything search
-                endpoint = f"{self.base_url}/everything"
-                
-                # Set up parameters
-                params = {
-                    "q": query,
-                    "from": from_date,
-                    "to": to_date,
-                    "language": "en",
-                    "sortBy": "relevancy",
-                    "pageSize": max_articles // len(queries) + 5  # Request a few extra per query
-                }
-                
-                # Make the request
-                response = requests.get(endpoint, headers=self.headers, params=params)
-                response.raise_for_status()  # Raise exception for HTTP errors
+        api_source = (registry or get_source_registry()).get("NewsAPI")
+        if api_source and api_source.get("queries"):
+            self.queries = list(api_source["queries"])
+        if api_source and api_source.get("keywords"):
+            self.relevant_keywords = list(api_source["keywords"])
+        
+        # Batched mode: results per request (NewsAPI allows up to 100) and pages per merged query
+        self.page_size = 100
+        self.max_pages = 3
+        self.quota = QuotaTracker()
+        
+        # Every request has a (connect, read) timeout; separate queries run with at
+        # most max_parallel in flight, and all requests pause together after a 429
+        self.request_timeout = (5, 20)
+        self.max_parallel = 4
+        self.default_backoff = 30
+        self.max_backoff = 120
+        self._backoff_lock = threading.Lock()
+        self._backoff_until = 0.0
+    
+    def fetch_tech_ai_news(self, days=1, max_articles=20, mode="batched", incremental=False):
+        """
+        Fetch recent tech and AI news articles
+        
+        Args:
+            days (int): How many days back to search for news
+            max_articles (int): Maximum number of articles to retrieve
+            mode (str): "batched" merges the queries into as few OR queries as possible and
+                pages through them; "separate" sends one request per configured query,
+                up to max_parallel at a time
+            incremental (bool): Only request articles published after the newest one seen
+                for each query in earlier runs, within the days window. The new high-water
+                marks are only persisted when the caller calls self.watermarks.save() after
+                handling the articles
+            
+        Returns:
+            list: List of news article dictionaries
+        """
+        from_date, to_date = self._date_range(days, precise=incremental)
+        self.quota.reset()
+        
+        if mode == "batched":
+            all_articles = self._fetch_batched(from_date, to_date, max_articles, incremental)
+        else:
+            all_articles = self._fetch_separate(from_date, to_date, max_articles, incremental)
+        
+        self.quota.report(mode)
+        return self._finalize_articles(all_articles, max_articles)
+    
+    def _fetch_separate(self, from_date, to_date, max_articles, incremental=False):
+        """Send one request per configured query, up to max_parallel at a time"""
+        def fetch_query(query):
+            # Incremental runs page through full pages so the whole delta is read
+            articles = []
+            complete = False
+            for page in (range(1, self.max_pages + 1) if incremental else [None]):
+                try:
+                    logger.info(f"Fetching news for query: {query}" if page is None
+                                else f"Fetching page {page} for query: {query}")
+                    params = self._build_query_params(
+                        query, from_date, to_date, max_articles, page=page, incremental=incremental
+                    )
+                    page_articles = self._fetch_articles(params)
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Request failed: {str(e)}")
+                    break
+                except json.JSONDecodeError:
+                    logger.error("Failed to parse API response")
+                    break
+                except Exception as e:
+                    logger.error(f"Unexpected error: {str(e)}")
+                    break
+                if page_articles is None:
+                    break
                 
-                # Parse the response
-                data = response.json()
+                articles.extend(page_articles)
+                if len(page_articles) < params["pageSize"]:
+                    complete = True
+                    break
+            
+            if incremental:
+                self._advance_watermark(query, articles, complete)
+            return articles
+        
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+            results = list(executor.map(fetch_query, self.queries))
+        
+        # Flatten in query order regardless of completion order
+        return [article for articles in results for article in articles]
+    
+    def _fetch_batched(self, from_date, to_date, max_articles, incremental=False):
+        """Page through the merged OR queries until there are enough relevant articles"""
+        all_articles = []
+        
+        for query in plan_queries(self.queries):
+            query_articles = []
+            complete = False
+            for page in range(1, self.max_pages + 1):
+                try:
+                    logger.info(f"Fetching page {page} for merged query ({len(query)} characters)")
+                    params = self._build_query_params(
+                        query, from_date, to_date, max_articles, page=page, incremental=incremental
+                    )
+                    articles = self._fetch_articles(params)
+                except requests.exceptions.RequestException as e:
+                    logger.error(f"Request failed: {str(e)}")
+                    break
+                except json.JSONDecodeError:
+                    logger.error("Failed to parse API response")
+                    break
+                except Exception as e:
+                    logger.error(f"Unexpected error: {str(e)}")
+                    break
+                if articles is None:
+                    break
                 
-                if data.get("status") == "ok":
-                    # Add articles to our collection
-                    articles = data.get("articles", [])
-                    logger.info(f"Retrieved {len(articles)} articles for query: {query}")
-                    all_articles.extend(articles)
-                else:
-                    logger.error(f"API returned error: {data.get('message', 'Unknown error')}")
+                all_articles.extend(articles)
+                query_articles.extend(articles)
+                # Incremental runs read the whole delta so the high-water mark leaves no gaps
+                if not incremental and self._has_enough(all_articles, max_articles):
+                    return all_articles
+                if len(articles) < self.page_size:
+                    # No more results for this query
+                    complete = True
+                    break
+            
+            if incremental:
+                self._advance_watermark(query, query_articles, complete)
+        
+        return all_articles
+    
+    def _advance_watermark(self, query, articles, complete):
+        """
+        Stage a query's new high-water mark if its delta was read to the end
+        
+        Results come newest first, so after a partial read (a full last page,
+        the page limit or a failed request) the older part of the delta is
+        still unread; the mark then stays where it was so no article is skipped.
+        """
+        if complete:
+            self.watermarks.advance(query, articles)
+        else:
+            logger.warning(f"Incremental fetch stopped before the end of the delta ({len(articles)} articles read), "
+                           f"keeping the high-water mark for query: {query[:80]}")
+    
+    def _has_enough(self, all_articles, max_articles):
+        """Check whether the articles fetched so far already yield max_articles relevant, unseen ones"""
+        candidates = self._filter_relevant_articles(self._remove_duplicates(all_articles))
+        if self.seen_index is not None:
+            candidates = [article for article in candidates if not self.seen_index.is_seen(article)]
+        return len(candidates) >= max_articles
+    
+    async def fetch_tech_ai_news_async(self, days=1, max_articles=20, async_fetcher=None, mode="batched",
+                                       incremental=False):
+        """
+        Fetch recent tech and AI news articles with all queries in flight at once
+        
+        Requests go through the shared async fetch loop, so they can overlap
+        with blog scraping submitted to the same loop.
+        
+        Args:
+            days (int): How many days back to search for news
+            max_articles (int): Maximum number of articles to retrieve
+            async_fetcher (AsyncFetcher, optional): Fetcher to use, defaults to the shared one
+            mode (str): "batched" (merged OR queries, paged) or "separate" (one request per query)
+            incremental (bool): Only request articles newer than each query's high-water mark;
+                persist the new marks with self.watermarks.save() after handling the articles
             
+        Returns:
+            list: List of news article dictionaries
+        """
+        async_fetcher = async_fetcher or get_async_fetcher()
+        
+        from_date, to_date = self._date_range(days, precise=incremental)
+        self.quota.reset()
+        parallel_limit = asyncio.Semaphore(self.max_parallel)
+        
+        async def fetch_page(query, page=None):
+            try:
+                logger.info(f"Fetching news for query: {query}" if page is None
+                            else f"Fetching page {page} for merged query ({len(query)} characters)")
+                params = self._build_query_params(
+                    query, from_date, to_date, max_articles, page=page, incremental=incremental
+                )
+                async with parallel_limit:
+                    return await self._fetch_articles_async(async_fetcher, params)
             except requests.exceptions.RequestException as e:
                 logger.error(f"Request failed: {str(e)}")
             except json.JSONDecodeError:
                 logger.error("Failed to parse API response")
             except Exception as e:
                 logger.error(f"Unexpected error: {str(e)}")
+            return None
         
-        # Remove duplicates (based on URL)
+        async def fetch_paged(query):
+            # Pages of one query depend on each other, so they go one at a time
+            articles = []
+            complete = False
+            for page in range(1, self.max_pages + 1):
+                page_articles = await fetch_page(query, page)
+                if page_articles is None:
+                    break
+                articles.extend(page_articles)
+                if len(page_articles) < self.page_size:
+                    complete = True
+                    break
+                if not incremental and self._has_enough(articles, max_articles):
+                    break
+            if incremental:
+                self._advance_watermark(query, articles, complete)
+            return articles
+        
+        if mode == "batched":
+            results = await asyncio.gather(*(fetch_paged(query) for query in plan_queries(self.queries)))
+        elif incremental:
+            # Incremental runs page through each query so the whole delta is read
+            results = await asyncio.gather(*(fetch_paged(query) for query in self.queries))
+        else:
+            results = await asyncio.gather(*(fetch_page(query) for query in self.queries))
+        
+        self.quota.report(mode)
+        
+        # Flatten in query order so results match the sequential fetch
+        all_articles = [article for articles in results if articles for article in articles]
+        return self._finalize_articles(all_articles, max_articles)
+    
+    def _fetch_articles(self, params):
+        """
+        Get the articles for one /everything request, from the response cache while it is fresh
+        
+        Args:
+            params (dict): Request parameters
+            
+        Returns:
+            list: Articles for the request, or None if the API reported an error
+        """
+        cached = self.response_cache.get(params)
+        if cached is not None:
+            logger.info(f"Using {len(cached)} cached articles for query: {params['q']}")
+            return cached
+        
+        response = self._request_newsapi(params)
+        articles = self._parse_query_response(response, params["q"])
+        # Errors such as rateLimited are transient and must not hide the query for the TTL
+        if articles is not None:
+            self.response_cache.set(params, articles)
+        return articles
+    
+    async def _fetch_articles_async(self, async_fetcher, params):
+        """Async counterpart of _fetch_articles"""
+        cached = self.response_cache.get(params)
+        if cached is not None:
+            logger.info(f"Using {len(cached)} cached articles for query: {params['q']}")
+            return cached
+        
+        response = await self._request_newsapi_async(async_fetcher, params)
+        articles = self._parse_query_response(response, params["q"])
+        if articles is not None:
+            self.response_cache.set(params, articles)
+        return articles
+    
+    def _request_newsapi(self, params):
+        """
+        Send one /everything request; every NewsAPI call goes through here
+        
+        Args:
+            params (dict): Request parameters
+            
+        Returns:
+            requests.Response: The response
+            
+        Raises:
+            NewsAPIRateLimited: If NewsAPI asked us to back off for longer than max_backoff
+        """
+        delay = self._backoff_remaining()
+        if delay > 0:
+            time.sleep(delay)
+        
+        self.quota.record(params["q"])
+        response = self.session.get(
+            f"{self.base_url}/everything", headers=self.headers, params=params, timeout=self.request_timeout
+        )
+        self._observe_rate_limit(response)
+        return response
+    
+    async def _request_newsapi_async(self, async_fetcher, params):
+        """Async counterpart of _request_newsapi using the shared fetch loop"""
+        delay = self._backoff_remaining()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        self.quota.record(params["q"])
+        response = await async_fetcher.fetch(
+            f"{self.base_url}/everything", timeout=self.request_timeout[1], headers=self.headers, params=params
+        )
+        self._observe_rate_limit(response)
+        return response
+    
+    def _backoff_remaining(self):
+        """
+        Get how long requests must still wait after a rate-limit response
+        
+        Returns:
+            float: Seconds to wait, 0 if requests may go out now
+            
+        Raises:
+            NewsAPIRateLimited: If the wait is longer than max_backoff
+        """
+        with self._backoff_lock:
+            remaining = self._backoff_until - time.time()
+        if remaining > self.max_backoff:
+            raise NewsAPIRateLimited(f"NewsAPI rate limit in effect for another {remaining:.0f} seconds")
+        return max(0.0, remaining)
+    
+    def _observe_rate_limit(self, response):
+        """Pause all NewsAPI requests after a 429 or when the rate-limit headers show no requests left"""
+        delay = None
+        if response.status_code == 429:
+            delay = parse_retry_after(response.headers.get("Retry-After")) or self.default_backoff
+        elif response.headers.get("X-RateLimit-Remaining", "").strip() == "0":
+            reset = response.headers.get("X-RateLimit-Reset", "").strip()
+            if reset.isdigit():
+                # Either an epoch timestamp or a number of seconds
+                delay = int(reset) - time.time() if int(reset) > 10 ** 9 else int(reset)
+            delay = delay if delay and delay > 0 else self.default_backoff
+        
+        if delay:
+            with self._backoff_lock:
+                self._backoff_until = max(self._backoff_until, time.time() + delay)
+            logger.warning(f"NewsAPI rate limit reached, pausing requests for {delay:.0f} seconds")
+    
+    def _date_range(self, days, precise=False):
+        """
+        Return the (from, to) window for the API
+        
+        Dates are formatted as YYYY-MM-DD, or as full UTC ISO timestamps when
+        precise is set (incremental fetches).
+        """
+        if precise:
+            end_date = datetime.now(timezone.utc)
+            start_date = end_date - timedelta(days=days)
+            return start_date.strftime(ISO_FORMAT), end_date.strftime(ISO_FORMAT)
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+        return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+    
+    def _build_query_params(self, query, from_date, to_date, max_articles, page=None, incremental=False):
+        """
+        Build the /everything request parameters for a query
+        
+        Paged requests (merged queries and incremental fetches) ask for full
+        pages; separate queries split max_articles between them and ask for a
+        few extra each. Incremental
+        requests start after the query's high-water mark, leave the window open
+        at the end (so retried runs share a cache entry) and sort newest first.
+        """
+        params = {
+            "q": query,
+            "from": from_date,
+            "to": to_date,
+            "language": "en",
+            "sortBy": "relevancy"
+        }
+        if incremental:
+            params["from"] = self.watermarks.start_for(query, from_date)
+            params["sortBy"] = "publishedAt"
+            del params["to"]
+        if page is None:
+            params["pageSize"] = max_articles // len(self.queries) + 5  # Request a few extra per query
+        else:
+            params["pageSize"] = self.page_size
+            params["page"] = page
+        return params
+    
+    def _parse_query_response(self, response, query):
+        """
+        Extract the articles from a NewsAPI response
+        
+        Args:
+            response: requests.Response from the /everything endpoint
+            query (str): Query the response belongs to
+            
+        Returns:
+            list: Articles in the response, or None if the API reported an error
+        """
+        response.raise_for_status()  # Raise exception for HTTP errors
+        
+        # Parse the response
+        data = response.json()
+        
+        if data.get("status") == "ok":
+            articles = data.get("articles", [])
+            logger.info(f"Retrieved {len(articles)} articles for query: {query}")
+            return articles
+        
+        logger.error(f"API returned error: {data.get('message', 'Unknown error')}")
+        return None
+    
+    def _finalize_articles(self, all_articles, max_articles):
+        """Deduplicate, filter and limit the raw articles from all queries"""
+        # Remove duplicates (same URL or same story)
         unique_articles = self._remove_duplicates(all_articles)
         
+        # Only pass on articles previous runs haven't handled
+        if self.seen_index is not None:
+            unique_articles = self.seen_index.filter_new(unique_articles)
+        
         # Filter for relevance and limit to max_articles
         filtered_articles = self._filter_relevant_articles(unique_articles)
         limited_articles = filtered_articles[:max_articles]
@@ -129,46 +509,31 @@ class NewsFetcher:
         return limited_articles
     
     def _remove_duplicates(self, articles):
-        """Remove duplicate articles based on URL"""
-        seen_urls = set()
-        unique_articles = []
-        
-        for article in articles:
-            url = article.get("url")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_articles.append(article)
-        
-        return unique_articles
+        """Remove duplicate URLs and near-duplicate stories"""
+        return dedupe_articles(articles)
     
     def _filter_relevant_articles(self, articles):
         """
         Filter articles for relevance to tech and AI
         
         This is a simple keyword-based filter. In a production system,
-        you might want to use more sophisticated NLP techniques.
+        you might want to use more sophisticated NLP techniques. All keywords
+        are matched in one pass per field, and the keywords found are kept on
+        each returned article as "matched_keywords" for later ranking.
+        
+        Returns:
+            list: Copies of the relevant articles with matched_keywords added
         """
-        relevant_keywords = [
-            "chatgpt", "gpt-4", "gpt-5", "claude", "anthropic", 
-    "openai", "microsoft ai", "copilot", "kubernetes", 
-    "devops", "llm", "large language model"
-        ]
+        matcher = get_keyword_matcher(tuple(self.relevant_keywords))
         
         filtered_articles = []
         
         for article in articles:
-            title = article.get("title", "").lower()
-            description = article.get("description", "").lower()
-            content = article.get("content", "").lower()
-            
             # Check if any relevant keywords are in the title, description, or content
-            is_relevant = any(
-                keyword in title or keyword in description or keyword in content
-                for keyword in relevant_keywords
-            )
+            matched_keywords = matcher.match_article(article)
             
-            if is_relevant:
-                filtered_articles.append(article)
+            if matched_keywords:
+                filtered_articles.append(dict(article, matched_keywords=matched_keywords))
         
         return filtered_articles
     
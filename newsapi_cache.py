@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+NewsAPI Response Cache for AI News Automation
+
+This module stores NewsAPI /everything results in a small SQLite database,
+keyed by the normalized request parameters (the API key is never part of
+the key), so scripts run close together or retried runs are answered
+locally instead of spending latency and daily request quota. Results for a
+date window that has already closed hardly change and are kept for days;
+results for a window that includes today expire after a few minutes. The
+database is bounded in size, oldest entries first.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('newsapi_cache')
+
+# Parameters that never affect the results and must not end up in the cache
+EXCLUDED_PARAMS = {"apiKey"}
+
+def cache_key(params):
+    """
+    Build a stable key from request parameters
+
+    Args:
+        params (dict): /everything request parameters
+
+    Returns:
+        str: Hex digest of the normalized parameters
+    """
+    normalized = {
+        key: str(value).strip()
+        for key, value in params.items()
+        if key not in EXCLUDED_PARAMS and value is not None
+    }
+    return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+class NewsAPICache:
+    """Class to cache NewsAPI results in SQLite with window-aware TTLs"""
+
+    def __init__(self, db_file="newsapi_cache.sqlite3", open_window_ttl=15 * 60,
+                 closed_window_ttl=7 * 24 * 3600, max_entries=500):
+        """
+        Initialize the cache and create its table if needed
+
+        Args:
+            db_file (str): Path of the SQLite database
+            open_window_ttl (int): Seconds results stay fresh when the window reaches today
+            closed_window_ttl (int): Seconds results stay fresh when the window ended before today
+            max_entries (int): Maximum number of cached responses; oldest are evicted first
+        """
+        self.db_file = db_file
+        self.open_window_ttl = open_window_ttl
+        self.closed_window_ttl = closed_window_ttl
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_file, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " params TEXT NOT NULL,"
+                " articles TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)")
+
+    def ttl_for(self, params):
+        """
+        Choose how long results for a request stay fresh
+
+        Args:
+            params (dict): Request parameters with a "to" date or timestamp
+
+        Returns:
+            int: TTL in seconds
+        """
+        window_end = str(params.get("to") or "")[:10]
+        today = datetime.now().strftime('%Y-%m-%d')
+        if window_end and window_end < today:
+            return self.closed_window_ttl
+        return self.open_window_ttl
+
+    def get(self, params):
+        """
+        Get cached articles for a request if they are still fresh
+
+        Args:
+            params (dict): Request parameters
+
+        Returns:
+            list: Cached articles, or None on a miss
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT articles FROM responses WHERE key = ? AND expires_at > ?",
+                (cache_key(params), time.time())
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def set(self, params, articles):
+        """
+        Store the articles returned for a request and evict old entries
+
+        Args:
+            params (dict): Request parameters
+            articles (list): Articles from a successful response
+        """
+        now = time.time()
+        stored_params = {key: value for key, value in params.items() if key not in EXCLUDED_PARAMS}
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, params, articles, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (cache_key(params), json.dumps(stored_params, sort_keys=True),
+                 json.dumps(articles, ensure_ascii=False), now, now + self.ttl_for(params))
+            )
+            self._connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            self._connection.execute(
+                "DELETE FROM responses WHERE key NOT IN "
+                "(SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        cache = NewsAPICache(":memory:")
+        params = {"q": "OpenAI", "from": "2026-10-01", "to": "2026-10-02", "language": "en", "apiKey": "secret"}
+        cache.set(params, [{"title": "Example", "url": "https://example.com"}])
+        print(f"TTL: {cache.ttl_for(params)} seconds")
+        print(f"Cached: {cache.get(dict(params, apiKey='other'))}")
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+NewsAPI High-Water Marks for AI News Automation
+
+This module remembers, per NewsAPI query, the newest publishedAt timestamp
+seen so far. Incremental fetches start just after that point instead of
+re-requesting the whole date window, so an hourly run only downloads,
+filters and deduplicates the articles published since the previous one.
+Marks only move once a query's delta has been read to the end, and new
+marks take effect when the caller saves them after its run succeeded, so
+a failed run is retried in full.
+"""
+
+import logging
+import threading
+from datetime import timedelta, timezone
+
+from date_normalizer import DateNormalizer
+from json_state import load_json_state, save_json_state
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('newsapi_watermarks')
+
+# Timestamp format NewsAPI accepts for from/to
+ISO_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+class HighWaterMarks:
+    """Class to persist the newest publishedAt seen per query"""
+
+    def __init__(self, state_file="newsapi_watermarks.json"):
+        """
+        Initialize the store and load any saved marks
+
+        Args:
+            state_file (str): Path of the JSON state file
+        """
+        self.state_file = state_file
+        self.date_normalizer = DateNormalizer()
+
+        self._lock = threading.Lock()
+        self._marks = self._load()
+        # Marks advanced during this run, applied on save()
+        self._pending = {}
+
+    def _load(self):
+        """Load marks from the state file, starting empty if it is missing or corrupt"""
+        marks = load_json_state(self.state_file, "high-water marks")
+        if marks:
+            logger.info(f"Loaded high-water marks for {len(marks)} queries from {self.state_file}")
+        return marks
+
+    def start_for(self, query, window_start):
+        """
+        Get the timestamp an incremental fetch for a query should start from
+
+        Args:
+            query (str): The q parameter
+            window_start (str): Start of the full window, as a UTC ISO timestamp
+
+        Returns:
+            str: One second after the query's high-water mark, or window_start if that is later
+        """
+        with self._lock:
+            mark = self._marks.get(query)
+        if not mark:
+            return window_start
+        next_second = self.date_normalizer.normalize(mark) + timedelta(seconds=1)
+        return max(window_start, next_second.strftime(ISO_FORMAT))
+
+    def advance(self, query, articles):
+        """
+        Stage a query's new high-water mark at the newest article returned for it
+
+        Only call this once the query's whole delta has been read; the mark
+        takes effect on save().
+
+        Args:
+            query (str): The q parameter
+            articles (list): Articles returned for the query
+        """
+        published = [
+            self.date_normalizer.normalize(article.get("publishedAt"))
+            for article in articles
+        ]
+        published = [value for value in published if value is not None]
+        if not published:
+            return
+
+        newest = max(published).astimezone(timezone.utc).strftime(ISO_FORMAT)
+        with self._lock:
+            if newest > max(self._marks.get(query, ""), self._pending.get(query, "")):
+                self._pending[query] = newest
+
+    def save(self):
+        """
+        Apply the marks staged this run and write them to disk
+
+        Call this only after the articles fetched this run were handled.
+
+        Returns:
+            bool: True if the marks were written
+        """
+        with self._lock:
+            self._marks.update(self._pending)
+            self._pending = {}
+            return save_json_state(self.state_file, self._marks, "high-water marks")
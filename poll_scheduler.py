@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Adaptive Polling Scheduler for AI News Automation
+
+This module polls many blogs and feeds without polling all of them every
+run. Each source gets an interval derived from how often it actually
+publishes (an exponentially weighted estimate of new articles per second),
+so busy sources are checked often and quiet ones rarely. Next-due polls are
+kept in a priority queue and run through a bounded worker pool, and an
+optional hourly poll budget stretches every interval when the total load
+would exceed it, keeping request volume roughly constant as sources are
+added. Scheduling state is persisted between runs.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from ai_blog_scraper_improved import AIBlogScraperImproved
+from json_state import load_json_state, save_json_state
+from url_canonicalizer import canonicalize_url
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('poll_scheduler')
+
+class PollScheduler:
+    """Class to poll sources on adaptive, per-source intervals"""
+
+    def __init__(self, scraper=None, state_file="poll_state.json", max_workers=8,
+                 min_interval=15 * 60, max_interval=24 * 3600, max_polls_per_hour=None,
+                 smoothing=0.3, known_urls_per_source=100):
+        """
+        Initialize the scheduler and load any saved state
+
+        Args:
+            scraper (AIBlogScraperImproved, optional): Scraper whose sources are polled
+            state_file (str): Path of the JSON file holding per-source scheduling state
+            max_workers (int): Maximum number of sources polled at the same time
+            min_interval (int): Shortest interval between polls of one source, in seconds
+            max_interval (int): Longest interval between polls of one source, in seconds
+            max_polls_per_hour (int, optional): Overall poll budget; intervals are stretched to stay within it
+            smoothing (float): Weight of the latest poll in the publishing-rate estimate (0-1)
+            known_urls_per_source (int): Canonical article URLs remembered per source to tell new articles from old
+        """
+        self.scraper = scraper or AIBlogScraperImproved()
+        self.state_file = state_file
+        self.max_workers = max_workers
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_polls_per_hour = max_polls_per_hour
+        self.smoothing = smoothing
+        self.known_urls_per_source = known_urls_per_source
+
+        self._lock = threading.Lock()
+        self._sources = {blog["name"]: blog for blog in self.scraper.blogs}
+        self._state = self._load()
+
+        # Priority queue of (next_due, source name)
+        now = time.time()
+        self._queue = []
+        for name, blog in self._sources.items():
+            state = self._state.setdefault(name, self._initial_state(blog, now))
+            heapq.heappush(self._queue, (state["next_due"], name))
+
+    def _load(self):
+        """Load scheduling state, starting fresh if it is missing or corrupt"""
+        state = load_json_state(self.state_file, "polling state")
+        if state:
+            logger.info(f"Loaded polling state for {len(state)} sources from {self.state_file}")
+        return state
+
+    def _initial_state(self, blog, now):
+        """State for a source that has never been polled: due now, rate from its configured interval"""
+        interval = blog.get("poll_interval") or self.min_interval
+        return {
+            "rate": 1.0 / interval,
+            "interval": interval,
+            "next_due": now,
+            "last_polled": None,
+            "known_urls": []
+        }
+
+    def _clamp(self, interval):
+        """Keep an interval within the configured bounds"""
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def _load_factor(self):
+        """How much all intervals must be stretched to stay within the hourly poll budget"""
+        if not self.max_polls_per_hour:
+            return 1.0
+        polls_per_hour = sum(3600.0 / self._state[name]["interval"] for name in self._sources)
+        return max(1.0, polls_per_hour / self.max_polls_per_hour)
+
+    def _record_poll(self, name, articles, now):
+        """
+        Update a source's publishing-rate estimate and schedule its next poll
+
+        Args:
+            name (str): Source name
+            articles (list): Articles returned by the poll
+            now (float): Time the poll finished
+
+        Returns:
+            list: The articles that weren't seen in earlier polls of this source
+        """
+        with self._lock:
+            state = self._state[name]
+            # Canonical URLs, so tracking-parameter or scheme variants don't count as new
+            known = {canonicalize_url(url) for url in state["known_urls"]}
+            new_articles = []
+            new_urls = []
+            for article in articles:
+                url = canonicalize_url(article.get("url"))
+                if url not in known:
+                    new_articles.append(article)
+                    if url:
+                        known.add(url)
+                        new_urls.append(url)
+
+            # Blend the rate observed since the last poll into the estimate
+            if state["last_polled"]:
+                elapsed = max(1.0, now - state["last_polled"])
+                observed = len(new_articles) / elapsed
+                state["rate"] = self.smoothing * observed + (1 - self.smoothing) * state["rate"]
+
+            # Aim for about one new article per poll
+            base_interval = self._clamp(1.0 / state["rate"]) if state["rate"] > 0 else self.max_interval
+            state["interval"] = base_interval
+            interval = self._clamp(base_interval * self._load_factor())
+
+            state["last_polled"] = now
+            state["next_due"] = now + interval
+            state["known_urls"] = (new_urls + state["known_urls"])[:self.known_urls_per_source]
+            heapq.heappush(self._queue, (state["next_due"], name))
+
+        logger.info(f"{name}: {len(new_articles)} new articles, next poll in {interval / 60:.0f} minutes")
+        return new_articles
+
+    def due_sources(self, now=None):
+        """
+        Take every source whose next poll is due off the queue
+
+        Args:
+            now (float, optional): Current time, defaults to time.time()
+
+        Returns:
+            list: Source config dictionaries, most overdue first
+        """
+        now = now or time.time()
+        due = []
+        with self._lock:
+            while self._queue and self._queue[0][0] <= now:
+                _, name = heapq.heappop(self._queue)
+                if name in self._sources:
+                    due.append(self._sources[name])
+        return due
+
+    def seconds_until_next(self):
+        """
+        Get the time until the next source is due
+
+        Returns:
+            float: Seconds to wait, 0 if a source is already due, or None if nothing is scheduled
+        """
+        with self._lock:
+            if not self._queue:
+                return None
+            return max(0.0, self._queue[0][0] - time.time())
+
+    def run_due(self, max_articles_per_source=3, days_back=7):
+        """
+        Poll every due source through the worker pool
+
+        Args:
+            max_articles_per_source (int): Maximum number of articles per source
+            days_back (int): Only include articles published within this many days
+
+        Returns:
+            list: Articles that are new since the previous poll of their source
+        """
+        due = self.due_sources()
+        if not due:
+            return []
+
+        logger.info(f"Polling {len(due)} of {len(self._sources)} sources")
+        new_articles = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.scraper.scrape_source, blog, max_articles_per_source, days_back, save_cache=False
+                ): blog["name"]
+                for blog in due
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    articles = future.result()
+                except Exception as e:
+                    logger.error(f"Error polling {name}: {str(e)}")
+                    articles = []
+                new_articles.extend(self._record_poll(name, articles, time.time()))
+
+        # The HTTP cache is written once per batch rather than once per source
+        self.scraper.http_cache.save()
+        self.save()
+        return new_articles
+
+    def run_forever(self, on_articles, max_articles_per_source=3, days_back=7, stop_event=None):
+        """
+        Keep polling sources as they become due
+
+        Args:
+            on_articles: Callable receiving the list of new articles after each batch of polls
+            max_articles_per_source (int): Maximum number of articles per source
+            days_back (int): Only include articles published within this many days
+            stop_event (threading.Event, optional): Set to stop the loop
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            articles = self.run_due(max_articles_per_source, days_back)
+            if articles:
+                on_articles(articles)
+
+            wait = self.seconds_until_next()
+            if wait is None:
+                logger.warning("No sources to poll")
+                return
+            stop_event.wait(wait)
+
+    def save(self):
+        """
+        Write the scheduling state to disk
+
+        Returns:
+            bool: True if the state was written
+        """
+        with self._lock:
+            return save_json_state(self.state_file, self._state, "polling state")
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        scheduler = PollScheduler()
+        articles = scheduler.run_due(max_articles_per_source=3)
+        print(f"Found {len(articles)} new articles")
+        for article in articles:
+            print(f"- {article['title']} ({article['source']['name']})")
+
+        wait = scheduler.seconds_until_next()
+        if wait is not None:
+            print(f"Next source is due in {wait / 60:.0f} minutes")
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+NewsAPI Query Planner for AI News Automation
+
+This module turns the configured search queries into as few NewsAPI
+/everything requests as possible. Every query is split into its OR'd terms,
+duplicate terms are dropped, multi-word terms are grouped with AND so they
+keep the meaning they had as separate queries, and the terms are packed
+into boolean OR queries that stay within NewsAPI's 500-character limit for
+the q parameter. A small tracker counts the requests, and so the API quota,
+each run uses.
+"""
+
+import logging
+import re
+import threading
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('query_planner')
+
+# NewsAPI rejects q values longer than this
+MAX_QUERY_LENGTH = 500
+
+_OR_RE = re.compile(r'\s+OR\s+')
+_PLAIN_TERM_RE = re.compile(r'^[A-Za-z0-9]+$')
+
+def split_terms(query):
+    """
+    Split a query into its OR'd terms
+
+    Args:
+        query (str): Query such as "ChatGPT OR GPT-4"
+
+    Returns:
+        list: Terms with surrounding whitespace removed; explicitly quoted phrases keep their quotes
+    """
+    return [term.strip() for term in _OR_RE.split(query) if term.strip().strip('"').strip()]
+
+def _format_word(word):
+    """Quote a word unless it is plain, so terms like GPT-4 are matched literally"""
+    return word if _PLAIN_TERM_RE.match(word) else f'"{word}"'
+
+def format_term(term):
+    """
+    Format a term so it means the same inside a merged OR query as on its own
+
+    Unquoted words of a query all have to appear in an article, in any
+    order, so multi-word terms are grouped with AND ("Kubernetes AI" becomes
+    "(Kubernetes AND AI)"). Only words that must stay literal, like "GPT-4"
+    which would otherwise be read as an exclusion, and phrases quoted in the
+    configuration are quoted.
+
+    Args:
+        term (str): Search term
+
+    Returns:
+        str: Term ready to be joined into a q parameter
+    """
+    if len(term) > 1 and term.startswith('"') and term.endswith('"'):
+        return term
+    words = [_format_word(word) for word in term.split()]
+    if len(words) == 1:
+        return words[0]
+    return "(" + " AND ".join(words) + ")"
+
+def plan_queries(queries, max_length=MAX_QUERY_LENGTH):
+    """
+    Merge queries into as few OR queries as the length limit allows
+
+    Args:
+        queries (list): Configured queries, each possibly containing OR'd terms
+        max_length (int): Maximum length of one q parameter
+
+    Returns:
+        list: Query strings to send
+    """
+    terms = []
+    seen = set()
+    for query in queries:
+        for term in split_terms(query):
+            if term.lower() not in seen:
+                seen.add(term.lower())
+                terms.append(format_term(term))
+
+    planned = []
+    current = ""
+    for term in terms:
+        if len(term) > max_length:
+            logger.warning(f"Search term longer than {max_length} characters skipped: {term[:50]}...")
+            continue
+        candidate = f"{current} OR {term}" if current else term
+        if len(candidate) <= max_length:
+            current = candidate
+        else:
+            planned.append(current)
+            current = term
+    if current:
+        planned.append(current)
+
+    logger.info(f"Planned {len(planned)} NewsAPI queries for {len(terms)} search terms")
+    return planned
+
+class QuotaTracker:
+    """Class to count NewsAPI requests made during a run"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.by_query = {}
+
+    def reset(self):
+        """Start counting a new run"""
+        with self._lock:
+            self.requests = 0
+            self.by_query = {}
+
+    def record(self, query):
+        """
+        Count one request
+
+        Args:
+            query (str): The q parameter of the request
+        """
+        with self._lock:
+            self.requests += 1
+            self.by_query[query] = self.by_query.get(query, 0) + 1
+
+    def report(self, mode):
+        """
+        Log the quota used since the last reset
+
+        Args:
+            mode (str): Fetch mode used for the run
+        """
+        with self._lock:
+            logger.info(f"NewsAPI quota used this run: {self.requests} requests "
+                        f"for {len(self.by_query)} queries ({mode} mode)")
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        queries = [
+            "artificial intelligence", "machine learning", "ChatGPT OR GPT-4",
+            "Claude AI OR Anthropic", "OpenAI", "Microsoft AI OR Microsoft Copilot"
+        ]
+        for query in plan_queries(queries):
+            print(f"{len(query):3} chars: {query}")
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
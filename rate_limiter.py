@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Per-Host Rate Limiter for AI News Automation
+
+This module keeps one token bucket per host so every component that talks
+to the same site (blog scraping, description enrichment, link validation)
+shares a single request budget for it, while requests to different hosts
+never wait on each other. Hosts can be given their own rate and burst, a
+robots.txt Crawl-delay slows crawled hosts down further, and a 429/503
+response with Retry-After pauses the host for the requested time.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from http_session import get_session
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('rate_limiter')
+
+def _host_of(url_or_host):
+    """Get the lowercase host from a URL, or return a bare host unchanged"""
+    if "://" in url_or_host:
+        return urlparse(url_or_host).netloc.lower()
+    return url_or_host.lower()
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header value
+
+    Args:
+        value (str): Delay in seconds or an HTTP date
+
+    Returns:
+        float: Seconds to wait, or None if the value can't be parsed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of blocking"""
+
+    def __init__(self, rate, burst):
+        """
+        Args:
+            rate (float): Tokens added per second
+            burst (int): Maximum number of tokens, i.e. requests allowed back to back
+        """
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def reserve(self, now):
+        """
+        Take a token, going into debt if none is available
+
+        Returns:
+            float: Seconds until the reserved token is actually available
+        """
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+class HostRateLimiter:
+    """Class to rate-limit requests per host with shared token buckets"""
+
+    def __init__(self, default_rate=0.5, default_burst=1, respect_robots=True, user_agent="*", session=None):
+        """
+        Initialize the limiter
+
+        Args:
+            default_rate (float): Requests per second allowed for hosts without their own settings
+            default_burst (int): Requests allowed back to back for hosts without their own settings
+            respect_robots (bool): Read each crawled host's robots.txt once and honour its Crawl-delay
+            user_agent (str): User agent to look up in robots.txt
+            session (requests.Session, optional): HTTP session used for robots.txt, defaults to the shared pooled session
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        self.session = session or get_session()
+
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._host_settings = {}
+        self._robots_checked = set()
+
+    def configure_host(self, url_or_host, rate=None, burst=None):
+        """
+        Set the request budget for a host
+
+        Args:
+            url_or_host (str): Host name or any URL on the host
+            rate (float, optional): Requests per second, defaults to default_rate
+            burst (int, optional): Requests allowed back to back, defaults to default_burst
+        """
+        host = _host_of(url_or_host)
+        rate = rate or self.default_rate
+        burst = burst or self.default_burst
+
+        with self._lock:
+            self._host_settings[host] = (rate, burst)
+            bucket = self._buckets.get(host)
+            if bucket is not None:
+                bucket.rate, bucket.burst = rate, burst
+                bucket.tokens = min(bucket.tokens, burst)
+        logger.info(f"Rate limit for {host}: {rate} requests/second, burst {burst}")
+
+    def _bucket_for(self, host):
+        """Get or create a host's bucket; the caller must hold the lock"""
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, burst = self._host_settings.get(host, (self.default_rate, self.default_burst))
+            bucket = self._buckets[host] = TokenBucket(rate, burst)
+        return bucket
+
+    def reserve(self, url):
+        """
+        Reserve a request slot for the URL's host without blocking
+
+        Args:
+            url (str): URL about to be requested
+
+        Returns:
+            float: Seconds the caller must wait before sending the request
+        """
+        host = _host_of(url)
+        with self._lock:
+            return self._bucket_for(host).reserve(time.monotonic())
+
+    def acquire(self, url, check_robots=False):
+        """
+        Wait until a request to the URL's host is allowed
+
+        Args:
+            url (str): URL about to be requested
+            check_robots (bool): The host is being crawled, so read its robots.txt Crawl-delay
+                first; one-off requests like link checks skip the extra round trip
+        """
+        if check_robots:
+            self._check_robots(url)
+        delay = self.reserve(url)
+        if delay > 0:
+            logger.debug(f"Waiting {delay:.2f} seconds before requesting {url}")
+            time.sleep(delay)
+
+    async def acquire_async(self, url, check_robots=False):
+        """
+        Async counterpart of acquire that doesn't block the event loop
+
+        Args:
+            url (str): URL about to be requested
+            check_robots (bool): The host is being crawled, so read its robots.txt Crawl-delay first
+        """
+        if check_robots and self.respect_robots and _host_of(url) not in self._robots_checked:
+            await asyncio.get_running_loop().run_in_executor(None, self._check_robots, url)
+        delay = self.reserve(url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def penalize(self, url, delay):
+        """
+        Pause all requests to the URL's host
+
+        Args:
+            url (str): Any URL on the host
+            delay (float): Seconds to pause
+        """
+        host = _host_of(url)
+        with self._lock:
+            bucket = self._bucket_for(host)
+            bucket.paused_until = max(bucket.paused_until, time.monotonic() + delay)
+        logger.warning(f"Pausing requests to {host} for {delay:.0f} seconds")
+
+    def observe(self, response):
+        """
+        Pause the response's host if it asked the client to slow down
+
+        Args:
+            response: requests.Response to inspect
+        """
+        if response.status_code not in (429, 503):
+            return
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay:
+            self.penalize(response.url, delay)
+
+    def _check_robots(self, url):
+        """Read the host's robots.txt once and slow the host down to its Crawl-delay"""
+        if not self.respect_robots:
+            return
+        parsed = urlparse(url)
+        host = parsed.netloc.lower()
+        with self._lock:
+            if host in self._robots_checked:
+                return
+            self._robots_checked.add(host)
+
+        try:
+            response = self.session.get(f"{parsed.scheme}://{host}/robots.txt", timeout=(3, 5))
+            if response.status_code != 200:
+                return
+            robots = RobotFileParser()
+            robots.parse(response.text.splitlines())
+            crawl_delay = robots.crawl_delay(self.user_agent)
+        except Exception as e:
+            logger.debug(f"Could not read robots.txt for {host}: {str(e)}")
+            return
+
+        if crawl_delay:
+            with self._lock:
+                rate, burst = self._host_settings.get(host, (self.default_rate, self.default_burst))
+            if float(crawl_delay) > 1 / rate:
+                logger.info(f"{host} asks for a Crawl-delay of {crawl_delay} seconds")
+                self.configure_host(host, rate=1 / float(crawl_delay), burst=1)
+
+_shared_limiter = None
+_shared_limiter_lock = threading.Lock()
+
+def get_rate_limiter():
+    """
+    Get the process-wide HostRateLimiter, creating it on first use
+
+    Returns:
+        HostRateLimiter: Shared limiter instance
+    """
+    global _shared_limiter
+    with _shared_limiter_lock:
+        if _shared_limiter is None:
+            _shared_limiter = HostRateLimiter()
+        return _shared_limiter
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        limiter = HostRateLimiter(default_rate=2, default_burst=2, respect_robots=False)
+        limiter.configure_host("slow.example.com", rate=0.5)
+
+        for url in ["https://fast.example.com/a", "https://fast.example.com/b",
+                    "https://fast.example.com/c", "https://slow.example.com/a",
+                    "https://slow.example.com/b"]:
+            print(f"{url}: wait {limiter.reserve(url):.2f}s")
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Local Relevance Ranker for AI News Automation
+
+This module scores articles locally so only the most promising candidates
+are sent to Claude for the final selection, keeping the selection prompt
+small no matter how many articles were collected. The score combines BM25
+relevance of the title and description against a topic profile, the
+keyword hits recorded by the news fetcher, a credibility weight per source
+and an exponential recency decay. Term statistics are computed once per
+batch, so ranking thousands of articles takes milliseconds.
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from datetime import datetime, timezone
+
+from date_normalizer import DateNormalizer
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('relevance_ranker')
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+(?:[-.][a-z0-9]+)*')
+
+# Terms describing the news this account covers, with their weights
+DEFAULT_TOPIC_PROFILE = {
+    "ai": 1.5, "artificial": 1.0, "intelligence": 1.0, "llm": 1.5, "llms": 1.5,
+    "model": 1.0, "models": 1.0, "openai": 1.5, "anthropic": 1.5, "claude": 1.5,
+    "gpt": 1.2, "gpt-4": 1.2, "gpt-5": 1.2, "chatgpt": 1.2, "gemini": 1.2, "copilot": 1.0,
+    "machine": 0.8, "learning": 0.8, "neural": 0.8, "deep": 0.5, "generative": 1.0,
+    "agent": 1.0, "agents": 1.0, "training": 0.7, "inference": 0.7, "open-source": 0.7,
+    "research": 0.6, "launch": 0.6, "launches": 0.6, "release": 0.6, "releases": 0.6,
+    "kubernetes": 0.6, "devops": 0.6
+}
+
+# Credibility weights by source name; unlisted sources weigh 1.0
+DEFAULT_SOURCE_WEIGHTS = {
+    "OpenAI": 1.3, "Anthropic": 1.3, "Google AI": 1.25, "Microsoft AI": 1.2,
+    "Meta AI": 1.2, "Hugging Face": 1.2, "Reuters": 1.2, "Associated Press": 1.2,
+    "Ars Technica": 1.15, "The Verge": 1.1, "TechCrunch": 1.1, "Wired": 1.1,
+    "MIT Technology Review": 1.2, "VentureBeat": 1.05
+}
+
+def tokenize(text):
+    """
+    Split text into lowercase terms
+
+    Args:
+        text (str): Text to tokenize; None is treated as empty
+
+    Returns:
+        list: Terms
+    """
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+class RelevanceRanker:
+    """Class to pre-rank articles with BM25, source credibility and recency"""
+
+    def __init__(self, topic_profile=None, source_weights=None, half_life_hours=24,
+                 k1=1.5, b=0.75, title_weight=2, keyword_bonus=0.5):
+        """
+        Initialize the ranker
+
+        Args:
+            topic_profile (dict, optional): Term to weight mapping the articles are scored against
+            source_weights (dict, optional): Source name to credibility weight mapping
+            half_life_hours (float): Age at which the recency factor halves
+            k1 (float): BM25 term-frequency saturation
+            b (float): BM25 length normalization
+            title_weight (int): How many times title terms count compared to description terms
+            keyword_bonus (float): Score added per keyword recorded in matched_keywords
+        """
+        self.topic_profile = {
+            term.lower(): weight for term, weight in (topic_profile or DEFAULT_TOPIC_PROFILE).items()
+        }
+        self.source_weights = source_weights or DEFAULT_SOURCE_WEIGHTS
+        self.half_life_hours = half_life_hours
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self.keyword_bonus = keyword_bonus
+        self.date_normalizer = DateNormalizer()
+
+    def _term_counts(self, article):
+        """Count the profile terms in an article, with title terms weighted up"""
+        title_terms = tokenize(article.get("title"))
+        description_terms = tokenize(article.get("description"))
+        counts = Counter(description_terms)
+        for term in title_terms:
+            counts[term] += self.title_weight
+        length = len(title_terms) * self.title_weight + len(description_terms)
+        return {term: count for term, count in counts.items() if term in self.topic_profile}, length
+
+    def _recency(self, article, now):
+        """Exponential decay by article age; undated articles count as one half-life old"""
+        published = self.date_normalizer.normalize(article.get("publishedAt"), (article.get("source") or {}).get("name"))
+        if published is None:
+            return 0.5
+        age_hours = max(0.0, (now - published).total_seconds() / 3600)
+        return 0.5 ** (age_hours / self.half_life_hours)
+
+    def score(self, articles):
+        """
+        Score a batch of articles
+
+        Args:
+            articles (list): Article dictionaries
+
+        Returns:
+            list: Scores in the same order as the articles
+        """
+        if not articles:
+            return []
+
+        documents = [self._term_counts(article) for article in articles]
+        average_length = sum(length for _, length in documents) / len(documents) or 1.0
+
+        # Document frequencies and IDF are computed once for the batch
+        document_frequency = Counter(term for counts, _ in documents for term in counts)
+        total = len(documents)
+        idf = {
+            term: math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+
+        now = datetime.now(timezone.utc)
+        scores = []
+        for article, (counts, length) in zip(articles, documents):
+            length_norm = self.k1 * (1 - self.b + self.b * length / average_length)
+            bm25 = sum(
+                self.topic_profile[term] * idf[term] * count * (self.k1 + 1) / (count + length_norm)
+                for term, count in counts.items()
+            )
+            relevance = 1 + bm25 + self.keyword_bonus * len(article.get("matched_keywords") or [])
+            credibility = self.source_weights.get((article.get("source") or {}).get("name"), 1.0)
+            scores.append(relevance * credibility * self._recency(article, now))
+        return scores
+
+    def rank(self, articles, top_k=None):
+        """
+        Order articles from most to least promising
+
+        Args:
+            articles (list): Article dictionaries
+            top_k (int, optional): Only return this many articles
+
+        Returns:
+            list: Articles sorted by descending score (ties keep their input order)
+        """
+        scores = self.score(articles)
+        order = sorted(range(len(articles)), key=lambda index: scores[index], reverse=True)
+        if top_k is not None:
+            order = order[:top_k]
+        return [articles[index] for index in order]
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        ranker = RelevanceRanker()
+        articles = [
+            {"title": "Anthropic releases new Claude model", "description": "The LLM improves agents",
+             "source": {"name": "Anthropic"}, "publishedAt": datetime.now(timezone.utc).isoformat()},
+            {"title": "Stock market update", "description": "Shares were flat",
+             "source": {"name": "Example News"}, "publishedAt": "2026-01-01T00:00:00Z"},
+            {"title": "OpenAI launches GPT-5", "description": None,
+             "source": {"name": "The Verge"}, "publishedAt": None}
+        ]
+        for article, score in zip(articles, ranker.score(articles)):
+            print(f"{score:8.4f}  {article['title']}")
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
@@ -48,14 +48,9 @@ def run_enhanced_automation():
         # Combine the results
         combined_articles = articles + scraped_articles
         
-        # Remove duplicates based on URL
-        seen_urls = set()
-        unique_articles = []
-        for article in combined_articles:
-            url = article.get("url")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_articles.append(article)
+        # Remove duplicates (same URL or same story)
+        from story_dedup import dedupe_articles
+        unique_articles = dedupe_articles(combined_articles)
         
         # Save the combined results
         with open("latest_ai_news.json", 'w', encoding='utf-8') as f:
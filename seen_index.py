@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Seen Article Index for AI News Automation
+
+This module remembers which articles earlier runs already handled, keyed by
+canonical URL and by a hash of the normalized title, so the same post is
+recognised even when it shows up under a slightly different URL. Runs mark
+the articles they actually posted, so later runs don't enrich or send those
+to Claude again, while candidates that weren't selected stay eligible.
+Entries expire after a configurable age.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+
+from json_state import load_json_state, save_json_state
+from url_canonicalizer import canonicalize_url
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('seen_index')
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def canonical_url(url):
+    """
+    Normalize a URL for comparison (see url_canonicalizer.canonicalize_url)
+
+    Args:
+        url (str): Article URL
+
+    Returns:
+        str: Canonical form of the URL, or an empty string if there is none
+    """
+    return canonicalize_url(url)
+
+def content_hash(article):
+    """
+    Hash an article's normalized title
+
+    Args:
+        article (dict): Article dictionary
+
+    Returns:
+        str: Hex digest, or None if the article has no title
+    """
+    title = _WHITESPACE_RE.sub(" ", article.get("title") or "").strip().lower()
+    if not title:
+        return None
+    return hashlib.sha1(title.encode("utf-8")).hexdigest()
+
+class SeenArticleIndex:
+    """Class to persist which articles previous runs have already processed"""
+
+    def __init__(self, index_file="seen_articles.json", max_age_days=30):
+        """
+        Initialize the index and load any existing entries from disk
+
+        Args:
+            index_file (str): Path of the JSON index file
+            max_age_days (int): Days an article is remembered after it was last seen
+        """
+        self.index_file = index_file
+        self.max_age = max_age_days * 24 * 3600
+
+        self._lock = threading.Lock()
+        self._urls, self._hashes = self._load()
+
+    def _load(self):
+        """Load entries from the index file, starting empty if it is missing or corrupt"""
+        data = load_json_state(self.index_file, "seen article index")
+        urls, hashes = data.get("urls", {}), data.get("hashes", {})
+        if urls:
+            logger.info(f"Loaded {len(urls)} seen articles from {self.index_file}")
+        return urls, hashes
+
+    def is_seen(self, article):
+        """
+        Check whether an article was handled by a previous run
+
+        Args:
+            article (dict): Article dictionary with url and title
+
+        Returns:
+            bool: True if its canonical URL or title hash is known
+        """
+        url = canonical_url(article.get("url"))
+        digest = content_hash(article)
+        with self._lock:
+            return (bool(url) and url in self._urls) or (digest is not None and digest in self._hashes)
+
+    def filter_new(self, articles):
+        """
+        Drop articles handled by previous runs
+
+        Args:
+            articles (list): Article dictionaries
+
+        Returns:
+            list: Articles not seen before, in their original order
+        """
+        new_articles = [article for article in articles if not self.is_seen(article)]
+        skipped = len(articles) - len(new_articles)
+        if skipped:
+            logger.info(f"Skipped {skipped} articles already seen in previous runs")
+        return new_articles
+
+    def mark(self, articles):
+        """
+        Record articles as handled
+
+        Args:
+            articles (list): Article dictionaries
+        """
+        now = time.time()
+        with self._lock:
+            for article in articles:
+                url = canonical_url(article.get("url"))
+                digest = content_hash(article)
+                if url:
+                    self._urls[url] = now
+                if digest is not None:
+                    self._hashes[digest] = now
+
+    def save(self):
+        """
+        Drop expired entries and write the index to disk
+
+        Returns:
+            bool: True if the index was written
+        """
+        with self._lock:
+            cutoff = time.time() - self.max_age
+            self._urls = {key: seen_at for key, seen_at in self._urls.items() if seen_at >= cutoff}
+            self._hashes = {key: seen_at for key, seen_at in self._hashes.items() if seen_at >= cutoff}
+
+            saved = save_json_state(
+                self.index_file, {"urls": self._urls, "hashes": self._hashes}, "seen article index"
+            )
+            if saved:
+                logger.info(f"Saved {len(self._urls)} seen articles to {self.index_file}")
+            return saved
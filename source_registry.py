@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Source Registry for AI News Automation
+
+This module loads the news sources (company blogs, RSS/Atom feeds and the
+NewsAPI search) from a declarative JSON, TOML or YAML file instead of code,
+so adding a source is a config change. Each file is compiled once per
+process: per-source settings are merged with the file's defaults, required
+fields are checked and CSS selectors are compiled up front, and invalid
+sources are reported and skipped instead of failing at scrape time.
+
+Example entry (JSON):
+    {
+        "name": "Example AI",
+        "type": "blog",
+        "url": "https://example.com/blog",
+        "article_selector": "article",
+        "title_selector": "h2 a",
+        "concurrency": 2,
+        "timeout": 15,
+        "poll_interval": 3600,
+        "parser_backend": "lxml",
+        "rate_limit": {"rate": 0.5, "burst": 1}
+    }
+"""
+
+import json
+import logging
+import os
+import threading
+
+import soupsieve
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('source_registry')
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+DEFAULT_SOURCES_FILE = os.getenv(
+    'AI_NEWS_SOURCES_FILE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sources.json')
+)
+
+SOURCE_TYPES = ("blog", "feed", "api")
+
+# Settings every source ends up with, unless the file's defaults override them
+BUILTIN_DEFAULTS = {
+    "enabled": True,
+    "concurrency": 2,
+    "timeout": 15,
+    "poll_interval": 3600,
+    "parser_backend": None,
+    "rate_limit": None
+}
+
+# Fields the scraper reads from every blog or feed config
+BLOG_DEFAULTS = {
+    "url": "",
+    "article_selector": "",
+    "title_selector": "",
+    "date_selector": None,
+    "description_selector": None,
+    "base_url": "",
+    "use_rss": False,
+    "rss_url": ""
+}
+
+REQUIRED_FIELDS = {
+    "blog": ("url", "article_selector", "title_selector"),
+    "feed": ("rss_url",),
+    "api": ()
+}
+
+SELECTOR_FIELDS = ("article_selector", "title_selector", "date_selector", "description_selector")
+
+class SourceConfigError(ValueError):
+    """Raised when a source definition is invalid"""
+
+def _read_file(path):
+    """
+    Read a sources file, choosing the format from its extension
+
+    Args:
+        path (str): Path to a .json, .toml, .yaml or .yml file
+
+    Returns:
+        dict: Parsed document
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == ".toml":
+        if tomllib is None:
+            raise SourceConfigError("TOML source files need Python 3.11 or newer")
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+
+    if extension in (".yaml", ".yml"):
+        if yaml is None:
+            raise SourceConfigError("YAML source files need PyYAML (pip install pyyaml)")
+        with open(path, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f) or {}
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def compile_source(definition, defaults=None):
+    """
+    Turn a source definition into the config dictionary the fetchers use
+
+    Args:
+        definition (dict): Source entry from the sources file
+        defaults (dict, optional): File-level defaults applied before the entry's own settings
+
+    Returns:
+        dict: Complete source config
+
+    Raises:
+        SourceConfigError: If the entry is missing fields or has an invalid selector
+    """
+    name = definition.get("name")
+    if not name:
+        raise SourceConfigError("Source without a name")
+
+    source_type = definition.get("type", "blog")
+    if source_type not in SOURCE_TYPES:
+        raise SourceConfigError(f"{name}: unknown source type '{source_type}'")
+
+    source = dict(BUILTIN_DEFAULTS)
+    if source_type != "api":
+        source.update(BLOG_DEFAULTS)
+    source.update({key: value for key, value in (defaults or {}).items() if value is not None})
+    source.update(definition)
+    source["type"] = source_type
+
+    missing = [field for field in REQUIRED_FIELDS[source_type] if not source.get(field)]
+    if missing:
+        raise SourceConfigError(f"{name}: missing {', '.join(missing)}")
+
+    if source_type == "feed":
+        # Feed-only sources have no HTML page to fall back to
+        source["use_rss"] = True
+        source["url"] = source["url"] or source["rss_url"]
+
+    # Compile selectors now so typos surface at startup, not mid-run
+    for field in SELECTOR_FIELDS:
+        selector = source.get(field)
+        if selector:
+            try:
+                soupsieve.compile(selector)
+            except soupsieve.SelectorSyntaxError as e:
+                raise SourceConfigError(f"{name}: invalid {field} '{selector}': {str(e).splitlines()[0]}")
+
+    return source
+
+class SourceRegistry:
+    """Class to hold the compiled source configs from a sources file"""
+
+    def __init__(self, path=DEFAULT_SOURCES_FILE):
+        """
+        Load and compile a sources file
+
+        Args:
+            path (str): Path to the JSON, TOML or YAML sources file
+        """
+        self.path = path
+        self._sources = self._load()
+
+    def _load(self):
+        """Compile every source in the file, skipping invalid ones"""
+        if not os.path.exists(self.path):
+            logger.warning(f"Sources file {self.path} not found, no sources configured")
+            return []
+
+        try:
+            document = _read_file(self.path)
+        except Exception as e:
+            logger.error(f"Could not read sources file {self.path}: {str(e)}")
+            return []
+
+        defaults = document.get("defaults", {})
+        sources = []
+        names = set()
+        for definition in document.get("sources", []):
+            try:
+                source = compile_source(definition, defaults)
+            except SourceConfigError as e:
+                logger.error(f"Skipping source in {self.path}: {str(e)}")
+                continue
+            if source["name"] in names:
+                logger.error(f"Skipping duplicate source '{source['name']}' in {self.path}")
+                continue
+            names.add(source["name"])
+            sources.append(source)
+
+        logger.info(f"Loaded {len(sources)} sources from {self.path}")
+        return sources
+
+    def sources(self, source_type=None):
+        """
+        Get the enabled sources
+
+        Args:
+            source_type (str, optional): Only return sources of this type ("blog", "feed" or "api")
+
+        Returns:
+            list: Source config dictionaries
+        """
+        return [
+            source for source in self._sources
+            if source["enabled"] and (source_type is None or source["type"] == source_type)
+        ]
+
+    def blogs(self):
+        """
+        Get the enabled blog and feed sources, in file order
+
+        Returns:
+            list: Source config dictionaries for the blog scraper
+        """
+        return [source for source in self.sources() if source["type"] in ("blog", "feed")]
+
+    def get(self, name):
+        """
+        Get a source by name
+
+        Args:
+            name (str): Source name
+
+        Returns:
+            dict: Source config, or None if there is no enabled source with that name
+        """
+        for source in self.sources():
+            if source["name"] == name:
+                return source
+        return None
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+def get_source_registry(path=DEFAULT_SOURCES_FILE):
+    """
+    Get the registry for a sources file, compiling it on first use
+
+    The file is compiled again only when it changes on disk.
+
+    Args:
+        path (str): Path to the sources file
+
+    Returns:
+        SourceRegistry: Compiled registry
+    """
+    path = os.path.abspath(path)
+    try:
+        modified = os.path.getmtime(path)
+    except OSError:
+        modified = None
+
+    with _registries_lock:
+        cached = _registries.get(path)
+        if cached is None or cached[0] != modified:
+            cached = _registries[path] = (modified, SourceRegistry(path))
+        return cached[1]
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        registry = get_source_registry()
+        for source in registry.sources():
+            print(f"{source['type']:5} {source['name']:15} poll every {source['poll_interval']}s, "
+                  f"timeout {source['timeout']}s, concurrency {source['concurrency']}")
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
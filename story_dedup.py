@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Story Clustering for AI News Automation
+
+This module collapses articles that cover the same story, e.g. ten outlets
+reporting the same OpenAI announcement, into one representative each.
+Every article is reduced to the set of meaningful words in its title and
+the start of its description, MinHash signatures of those sets are bucketed
+with locality-sensitive hashing (LSH) so only likely duplicates are ever
+compared. A candidate joins the cluster of an earlier representative only
+if both their titles and their full word sets overlap enough (Jaccard
+similarity); generic launch wording in the description alone never merges
+two stories, and clusters don't grow by chaining through their members.
+The work grows roughly linearly with the number of articles instead of
+comparing every pair.
+"""
+
+import hashlib
+import logging
+import re
+import struct
+from collections import defaultdict
+from functools import lru_cache
+
+from url_canonicalizer import canonicalize_url
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('story_dedup')
+
+_WORD_RE = re.compile(r'[a-z0-9]+(?:[-.][a-z0-9]+)*')
+
+# Words that say nothing about which story an article covers
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in into is it its new of on or "
+    "that the this to was what when why will with you your says said after over about "
+    "than more most just now".split()
+)
+
+# A 64-byte blake2b digest yields 32 16-bit MinHash values per word
+_SIGNATURE_LENGTH = 32
+_SIGNATURE_STRUCT = struct.Struct(f'<{_SIGNATURE_LENGTH}H')
+
+def _story_terms(article, description_words=40):
+    """
+    Get the sets of meaningful words describing an article's story
+
+    Args:
+        article (dict): Article dictionary
+        description_words (int): How many words of the description to use
+
+    Returns:
+        tuple: (title words, title and description words), lowercase without stopwords
+    """
+    title = frozenset(
+        word for word in _WORD_RE.findall((article.get("title") or "").lower()) if word not in STOPWORDS
+    )
+    description = _WORD_RE.findall((article.get("description") or "").lower())[:description_words]
+    return title, title | frozenset(word for word in description if word not in STOPWORDS)
+
+@lru_cache(maxsize=65536)
+def _term_hashes(term):
+    """Hash a word once for every MinHash permutation"""
+    return _SIGNATURE_STRUCT.unpack(hashlib.blake2b(term.encode("utf-8"), digest_size=64).digest())
+
+def jaccard(first, second):
+    """Jaccard similarity of two sets"""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+class StoryDeduplicator:
+    """Class to cluster articles covering the same story with MinHash LSH"""
+
+    def __init__(self, threshold=0.5, title_threshold=0.5, bands=16, rows=2, min_terms=3):
+        """
+        Initialize the deduplicator
+
+        Args:
+            threshold (float): Jaccard similarity of the title and description words at which
+                two articles can count as the same story
+            title_threshold (float): Jaccard similarity their titles must reach as well
+            bands (int): Number of LSH bands
+            rows (int): Signature values per band; bands * rows may not exceed 32
+            min_terms (int): Articles with fewer meaningful words are never clustered
+        """
+        if bands * rows > _SIGNATURE_LENGTH:
+            raise ValueError(f"bands * rows must not exceed {_SIGNATURE_LENGTH}")
+        self.threshold = threshold
+        self.title_threshold = title_threshold
+        self.bands = bands
+        self.rows = rows
+        self.min_terms = min_terms
+
+    def _signature(self, terms):
+        """Compute the MinHash signature of a word set"""
+        return [min(values) for values in zip(*(_term_hashes(term) for term in terms))]
+
+    def cluster(self, articles):
+        """
+        Group articles that cover the same story
+
+        Args:
+            articles (list): Article dictionaries
+
+        Returns:
+            list: Clusters as lists of article positions, ordered by their first article
+        """
+        terms = [_story_terms(article) for article in articles]
+
+        buckets = defaultdict(list)
+        for index, (_, article_terms) in enumerate(terms):
+            if len(article_terms) < self.min_terms:
+                continue
+            signature = self._signature(article_terms)
+            for band in range(self.bands):
+                key = (band, tuple(signature[band * self.rows:(band + 1) * self.rows]))
+                buckets[key].append(index)
+
+        # Earlier articles sharing a bucket with each article are its candidates
+        candidates = defaultdict(set)
+        for members in buckets.values():
+            for position, later in enumerate(members):
+                candidates[later].update(members[:position])
+
+        # Each article joins the earliest similar representative, compared on
+        # their exact word sets, or becomes a representative itself
+        representative_of = list(range(len(articles)))
+        for index in range(len(articles)):
+            for other in sorted(candidates[index]):
+                if representative_of[other] == other and self._same_story(terms[other], terms[index]):
+                    representative_of[index] = other
+                    break
+
+        clusters = defaultdict(list)
+        for index, representative in enumerate(representative_of):
+            clusters[representative].append(index)
+        return [clusters[representative] for representative in sorted(clusters)]
+
+    def _same_story(self, first, second):
+        """Check whether two articles' (title, all) word sets describe the same story"""
+        return (jaccard(first[0], second[0]) >= self.title_threshold
+                and jaccard(first[1], second[1]) >= self.threshold)
+
+    def dedupe(self, articles):
+        """
+        Keep one representative per story
+
+        The representative is the earliest article of its cluster, so callers
+        control precedence through the order of the list. Representatives of
+        larger clusters are copies carrying the other articles' URLs in
+        "related_urls".
+
+        Args:
+            articles (list): Article dictionaries
+
+        Returns:
+            list: Representatives in input order
+        """
+        representatives = []
+        for members in self.cluster(articles):
+            representative = articles[members[0]]
+            if len(members) > 1:
+                representative = dict(
+                    representative,
+                    related_urls=[articles[index].get("url") for index in members[1:]]
+                )
+            representatives.append(representative)
+        return representatives
+
+_default_deduplicator = StoryDeduplicator()
+
+def dedupe_articles(articles, deduplicator=None, resolver=None):
+    """
+    Remove duplicate URLs and near-duplicate stories
+
+    URLs are compared in canonical form, so tracking parameters, http vs
+    https and similar variants count as the same URL. Articles without a URL
+    are dropped, as the URL-based deduplication did.
+
+    Args:
+        articles (list): Article dictionaries, in order of precedence
+        deduplicator (StoryDeduplicator, optional): Deduplicator to use instead of the default one
+        resolver (RedirectResolver, optional): Also follows short links before comparing URLs
+
+    Returns:
+        list: Unique articles
+    """
+    canonicalize = resolver.resolve if resolver is not None else canonicalize_url
+    seen_urls = set()
+    unique_articles = []
+    for article in articles:
+        url = canonicalize(article.get("url"))
+        if url and url not in seen_urls:
+            seen_urls.add(url)
+            unique_articles.append(article)
+
+    representatives = (deduplicator or _default_deduplicator).dedupe(unique_articles)
+    if len(representatives) < len(unique_articles):
+        logger.info(f"Collapsed {len(unique_articles)} articles into {len(representatives)} distinct stories")
+    return representatives
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        articles = [
+            {"title": "OpenAI launches GPT-5, its most capable model yet",
+             "description": "OpenAI on Tuesday released GPT-5 to ChatGPT users", "url": "https://example.com/a"},
+            {"title": "OpenAI releases GPT-5 as its most capable model",
+             "description": "GPT-5 is rolling out to ChatGPT users on Tuesday", "url": "https://example.org/b"},
+            {"title": "Google releases Gemini 3 as its most capable model",
+             "description": "Gemini 3 is rolling out to users on Tuesday", "url": "https://example.com/d"},
+            {"title": "Anthropic adds memory to Claude",
+             "description": "Claude can now remember earlier conversations", "url": "https://example.net/c"}
+        ]
+        for article in dedupe_articles(articles):
+            print(article["title"], article.get("related_urls", []))
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
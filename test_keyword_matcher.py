@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Tests for the keyword matcher of AI News Automation
+"""
+
+import unittest
+
+from keyword_matcher import KeywordMatcher
+
+class KeywordMatcherTest(unittest.TestCase):
+    """Tests for KeywordMatcher.find"""
+
+    def test_whole_words_plurals_and_versions(self):
+        matcher = KeywordMatcher(("openai", "gpt-4", "large language model", "llm", "ai"))
+        found = matcher.find("OpenAI ships GPT-4o", "New large  language models and LLMs, the company said")
+        self.assertEqual(found, ["openai", "gpt-4", "large language model", "llm"])
+
+    def test_longer_keyword_wins_over_prefix(self):
+        matcher = KeywordMatcher(("microsoft", "microsoft ai"))
+        self.assertEqual(matcher.find("Microsoft AI unveils agents"), ["microsoft ai"])
+
+    def test_non_ascii_case_folding_does_not_hang(self):
+        # 'İ'.lower() and 'ſ' fold to text that can't be trimmed back to the keyword
+        self.assertEqual(KeywordMatcher(["anthropic"]).find("ANTHROPİC news"), ["anthropic"])
+        self.assertEqual(KeywordMatcher(["devops"]).find("DevOpſ news"), ["devops"])
+        self.assertEqual(KeywordMatcher(["gpt-4"]).find("GPT-4İ released"), ["gpt-4"])
+
+    def test_missing_fields_are_skipped(self):
+        self.assertEqual(KeywordMatcher(["ai"]).find(None, ""), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,9 +9,15 @@ import re
 import json
 import logging
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from urllib.parse import urlparse
 from datetime import datetime
 
+from http_session import get_session
+from link_cache import LinkValidationCache
+from rate_limiter import get_rate_limiter
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,9 +28,25 @@ logger = logging.getLogger('tweet_formatter')
 class TweetFormatter:
     """Class to format tweets and validate links"""
     
-    def __init__(self, max_length=280):
-        """Initialize the formatter with Twitter's character limit"""
+    def __init__(self, max_length=280, session=None, link_cache=None, rate_limiter=None):
+        """
+        Initialize the formatter with Twitter's character limit
+        
+        Args:
+            max_length (int): Maximum tweet length
+            session (requests.Session, optional): HTTP session to use, defaults to the shared pooled session
+            link_cache (LinkValidationCache, optional): Cache of earlier link checks, defaults to the on-disk cache
+            rate_limiter (HostRateLimiter, optional): Per-host request budget, defaults to the shared limiter
+        """
         self.max_length = max_length
+        self.session = session or get_session()
+        self.link_cache = link_cache or LinkValidationCache()
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        
+        # Links are checked in parallel under an overall deadline, in seconds
+        self.max_validation_workers = 8
+        self.validation_deadline = 10
+        
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
@@ -74,41 +96,92 @@ class TweetFormatter:
         url_pattern = r'https?://[^\s]+'
         return re.findall(url_pattern, text)
     
-    def _validate_links(self, links):
+    def _validate_links(self, links, deadline=None):
         """
-        Validate links and return only working ones
+        Validate links concurrently and return only working ones
+        
+        Links with a fresh entry in the link cache skip the network. The rest
+        are checked in their own workers and results are collected as they
+        complete, so one slow host does not hold up the others. Links still
+        unchecked when the deadline passes are treated as invalid.
         
         Args:
             links (list): List of URLs to validate
+            deadline (float, optional): Overall time budget in seconds, defaults to self.validation_deadline
             
         Returns:
-            list: List of valid URLs
+            list: List of valid URLs, in the same order as the input
         """
-        valid_links = []
+        if not links:
+            return []
+        
+        deadline = deadline or self.validation_deadline
+        results = {}
+        
+        for link in dict.fromkeys(links):
+            cached = self.link_cache.get(link)
+            if cached is not None:
+                results[link] = cached["valid"]
+                logger.info(f"Using cached result for link (status {cached['status']}): {link}")
         
-        for link in links:
+        unchecked_links = [link for link in dict.fromkeys(links) if link not in results]
+        if unchecked_links:
+            executor = ThreadPoolExecutor(max_workers=min(len(unchecked_links), self.max_validation_workers))
+            futures = {executor.submit(self._check_link, link): link for link in unchecked_links}
             try:
-                # Parse the URL to check if it's well-formed
-                parsed_url = urlparse(link)
-                if not parsed_url.netloc:
-                    logger.warning(f"Invalid URL format: {link}")
-                    continue
-                
-                # Check if the URL is accessible
-                response = requests.head(link, headers=self.headers, timeout=5, allow_redirects=True)
-                
-                # Consider 2xx status codes as valid
-                if 200 <= response.status_code < 300:
-                    valid_links.append(link)
-                    logger.info(f"Valid link: {link}")
-                else:
-                    logger.warning(f"Invalid link (status {response.status_code}): {link}")
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Error validating link {link}: {str(e)}")
-            except Exception as e:
-                logger.warning(f"Unexpected error validating link {link}: {str(e)}")
-        
-        return valid_links
+                for future in as_completed(futures, timeout=deadline):
+                    results[futures[future]] = future.result()
+            except FuturesTimeoutError:
+                unchecked = [link for link in unchecked_links if link not in results]
+                logger.warning(f"Link validation deadline of {deadline}s reached, {len(unchecked)} links unchecked: {unchecked}")
+            finally:
+                # Don't wait for stragglers past the deadline
+                executor.shutdown(wait=False, cancel_futures=True)
+            
+            self.link_cache.save()
+        
+        return [link for link in links if results.get(link)]
+    
+    def _check_link(self, link):
+        """
+        Check whether a single link is well-formed and reachable, recording the result in the link cache
+        
+        Args:
+            link (str): URL to check
+            
+        Returns:
+            bool: True if the link responded with a 2xx status
+        """
+        try:
+            # Parse the URL to check if it's well-formed
+            parsed_url = urlparse(link)
+            if not parsed_url.netloc:
+                logger.warning(f"Invalid URL format: {link}")
+                return False
+            
+            # Check if the URL is accessible, within the host's shared request budget
+            self.rate_limiter.acquire(link)
+            response = self.session.head(link, headers=self.headers, timeout=5, allow_redirects=True)
+            self.rate_limiter.observe(response)
+            
+            # Consider 2xx status codes as valid
+            is_valid = 200 <= response.status_code < 300
+            self.link_cache.set(link, is_valid, response.status_code, response.url)
+            
+            if is_valid:
+                logger.info(f"Valid link: {link}")
+                return True
+            
+            logger.warning(f"Invalid link (status {response.status_code}): {link}")
+            return False
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Error validating link {link}: {str(e)}")
+        except Exception as e:
+            logger.warning(f"Unexpected error validating link {link}: {str(e)}")
+        
+        # Unreachable links are cached like other failures, with the short negative TTL
+        self.link_cache.set(link, False)
+        return False
     
     def _clean_formatting(self, text):
         """Clean up spacing and formatting issues"""
@@ -13,6 +13,8 @@ import requests
 import time
 from typing import Optional, Dict, Any
 
+from http_session import get_session
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -29,7 +31,8 @@ class TwitterPoster:
         api_secret: Optional[str] = None,
         access_token: Optional[str] = None,
         access_secret: Optional[str] = None,
-        bearer_token: Optional[str] = None
+        bearer_token: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize the TwitterPoster with API credentials
@@ -40,6 +43,7 @@ class TwitterPoster:
             access_token (str, optional): Twitter access token. If not provided, will look for TWITTER_ACCESS_TOKEN env variable.
             access_secret (str, optional): Twitter access token secret. If not provided, will look for TWITTER_ACCESS_SECRET env variable.
             bearer_token (str, optional): Twitter bearer token. If not provided, will look for TWITTER_BEARER_TOKEN env variable.
+            session (requests.Session, optional): HTTP session to use, defaults to the shared pooled session
         """
         # Get credentials from parameters or environment variables
         self.api_key = api_key or os.getenv('TWITTER_API_KEY')
@@ -57,6 +61,8 @@ class TwitterPoster:
                 "- Or TWITTER_BEARER_TOKEN for app-only authentication"
             )
         
+        self.session = session or get_session()
+        
         # API endpoints
         self.base_url = "https://api.twitter.com/2"
         self.tweet_endpoint = f"{self.base_url}/tweets"
@@ -85,10 +91,11 @@ class TwitterPoster:
         try:
             # Make the API request
             logger.info("Posting tweet to Twitter")
-            response = requests.post(
+            response = self.session.post(
                 self.tweet_endpoint,
                 headers=headers,
-                json=payload
+                json=payload,
+                timeout=30
             )
             
             # Check for errors
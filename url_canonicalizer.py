@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+URL Canonicalizer for AI News Automation
+
+This module reduces the many spellings of an article URL (tracking
+parameters, http vs https, www. and default ports, fragments, trailing
+slashes, parameter order) to one canonical form. That form is the key for
+deduplication, the seen-article index and the link validation cache.
+Short links such as cnet.co/... can optionally be resolved to the URL they
+redirect to, with the results cached on disk so each link is only followed
+once.
+"""
+
+import logging
+import threading
+import time
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+
+from http_session import get_session
+from json_state import load_json_state, save_json_state
+from rate_limiter import get_rate_limiter
+
+# Set up logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('url_canonicalizer')
+
+# Query parameters that only track where a click came from
+TRACKING_PARAM_PREFIXES = ("utm_",)
+TRACKING_PARAMS = frozenset([
+    "fbclid", "gclid", "dclid", "gclsrc", "msclkid", "yclid", "igshid", "twclid",
+    "mc_cid", "mc_eid", "_hsenc", "_hsmi", "ref_src", "cmpid", "ocid", "smid"
+])
+
+# Hosts that only serve redirects to the real article
+SHORTENER_HOSTS = frozenset([
+    "bit.ly", "buff.ly", "cnet.co", "dlvr.it", "goo.gl", "ift.tt", "lnkd.in",
+    "ow.ly", "reut.rs", "t.co", "tinyurl.com", "trib.al", "wp.me", "zd.net"
+])
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+def _is_tracking_param(name):
+    """Check whether a query parameter is a tracking parameter"""
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+@lru_cache(maxsize=8192)
+def canonicalize_url(url):
+    """
+    Reduce a URL to its canonical form
+
+    http becomes https, the host is lowercased without "www." and default
+    ports, tracking parameters and the fragment are dropped, the remaining
+    query parameters are sorted and trailing slashes are removed. The result
+    is meant as a comparison key, not as a URL to request.
+
+    Args:
+        url (str): URL to canonicalize
+
+    Returns:
+        str: Canonical URL, or an empty string if there is none
+    """
+    if not url:
+        return ""
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        # Malformed (e.g. a non-numeric port); compare it as given
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    if port is not None and port != _DEFAULT_PORTS[scheme]:
+        host = f"{host}:{port}"
+
+    query = urlencode(sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name)
+    ))
+    return urlunsplit(("https", host, parts.path.rstrip("/"), query, ""))
+
+def is_short_link(url):
+    """
+    Check whether a URL points at a known link shortener
+
+    Args:
+        url (str): URL to check
+
+    Returns:
+        bool: True if the host is a shortener
+    """
+    try:
+        host = (urlsplit(url.strip()).hostname or "").lower()
+    except ValueError:
+        return False
+    return host.removeprefix("www.") in SHORTENER_HOSTS
+
+class RedirectResolver:
+    """Class to resolve short links to canonical article URLs with an on-disk cache"""
+
+    def __init__(self, cache_file="redirect_cache.json", ttl=30 * 24 * 3600, session=None,
+                 rate_limiter=None, timeout=5):
+        """
+        Initialize the resolver and load any cached redirects
+
+        Args:
+            cache_file (str): Path of the JSON cache file
+            ttl (int): Seconds a resolved redirect is trusted
+            session (requests.Session, optional): HTTP session to use, defaults to the shared pooled session
+            rate_limiter (HostRateLimiter, optional): Per-host request budget, defaults to the shared limiter
+            timeout (int): Timeout of one redirect lookup in seconds
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.session = session or get_session()
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self):
+        """Load cached redirects, starting empty if the file is missing or corrupt"""
+        entries = load_json_state(self.cache_file, "redirect cache")
+        if entries:
+            logger.info(f"Loaded {len(entries)} cached redirects from {self.cache_file}")
+        return entries
+
+    def resolve(self, url):
+        """
+        Get the canonical form of the URL a link finally points to
+
+        Only links on known shortener hosts are followed; everything else is
+        just canonicalized. If a short link cannot be followed, the canonical
+        form of the short link itself is returned and nothing is cached.
+
+        Args:
+            url (str): URL to resolve
+
+        Returns:
+            str: Canonical URL
+        """
+        canonical = canonicalize_url(url)
+        if not canonical or not is_short_link(url):
+            return canonical
+
+        with self._lock:
+            entry = self._entries.get(canonical)
+        if entry and time.time() - entry["resolved_at"] < self.ttl:
+            return entry["target"]
+
+        try:
+            self.rate_limiter.acquire(url)
+            response = self.session.head(url.strip(), timeout=self.timeout, allow_redirects=True)
+            self.rate_limiter.observe(response)
+            if response.status_code >= 400:
+                logger.warning(f"Could not resolve short link (status {response.status_code}): {url}")
+                return canonical
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Error resolving short link {url}: {str(e)}")
+            return canonical
+
+        target = canonicalize_url(response.url)
+        with self._lock:
+            self._entries[canonical] = {"target": target, "resolved_at": time.time()}
+        logger.info(f"Resolved short link {url} to {target}")
+        return target
+
+    def save(self):
+        """
+        Drop expired redirects and write the cache to disk
+
+        Returns:
+            bool: True if the cache was written
+        """
+        with self._lock:
+            now = time.time()
+            self._entries = {
+                url: entry for url, entry in self._entries.items()
+                if now - entry["resolved_at"] < self.ttl
+            }
+            return save_json_state(self.cache_file, self._entries, "redirect cache")
+
+
+# Example usage
+if __name__ == "__main__":
+    try:
+        for url in [
+            "http://www.Example.com:80/news/story/?utm_source=twitter&b=2&a=1#comments",
+            "https://example.com/news/story?a=1&b=2&fbclid=abc",
+            "https://cnet.co/3abcdef"
+        ]:
+            print(f"{canonicalize_url(url)}  short link: {is_short_link(url)}")
+
+    except Exception as e:
+        print(f"Error: {str(e)}")